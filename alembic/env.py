@@ -1,14 +1,19 @@
+import asyncio
 import os
 import sys
 sys.path.append(os.getcwd()) 
 
+from app.core.config import settings
 from app.db.base import Base 
+from app.db.search import is_search_object
+from app.db.session import get_async_url
+from app.models import task, task_counter, user  # noqa: F401  モデルをメタデータに登録
 
 
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
@@ -21,12 +26,23 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+# alembic.ini ではなくアプリの設定（DATABASE_URL）を使う。
+# アプリと同じ非同期ドライバで接続するため、同期ドライバ（psycopg2 等）は不要
+config.set_main_option("sqlalchemy.url", get_async_url(settings.DATABASE_URL))
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+
+def include_name(name, type_, parent_names) -> bool:
+    # 全文検索用のテーブル・インデックスはモデルに含まれないため、autogenerate の比較から外す
+    return not is_search_object(name)
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -49,6 +65,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -64,19 +81,35 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    connectable = engine_from_config(
+    # テストなど、呼び出し側から接続が渡された場合はそれを使う
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    asyncio.run(run_async_migrations())
+
+
+async def run_async_migrations() -> None:
+    connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
 
-        with context.begin_transaction():
-            context.run_migrations()
+    await connectable.dispose()
+
+
+def do_run_migrations(connection) -> None:
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_name=include_name
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,65 @@
+"""Add task title index and require created_at
+
+Revision ID: b7e2d4a9c615
+Revises: 9f4a1d6b3c82
+Create Date: 2026-10-18 21:37:52.604318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4a9c615'
+down_revision: Union[str, None] = '9f4a1d6b3c82'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# SQLite ではテーブルを作り直すとトリガーが消えるため、全文検索の同期トリガーを張り直す
+# （rowid は id のまま移るので tasks_fts の中身はそのまま使える）
+SQLITE_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description, owner_id)
+        VALUES (new.id, new.title, new.description, new.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', old.id, old.title, old.description, old.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description, owner_id
+    ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', old.id, old.title, old.description, old.owner_id);
+        INSERT INTO tasks_fts (rowid, title, description, owner_id)
+        VALUES (new.id, new.title, new.description, new.owner_id);
+    END
+    """,
+)
+
+
+def _alter_created_at(nullable: bool) -> None:
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=nullable)
+    if op.get_bind().dialect.name == "sqlite":
+        for statement in SQLITE_TRIGGERS:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    op.create_index('ix_tasks_owner_id_title_id', 'tasks', ['owner_id', 'title', 'id'], unique=False)
+    # 作成日時のない行は、既定値と同じく現在時刻で埋める
+    op.execute("UPDATE tasks SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+    _alter_created_at(nullable=False)
+
+
+def downgrade() -> None:
+    _alter_created_at(nullable=True)
+    op.drop_index('ix_tasks_owner_id_title_id', table_name='tasks')
@@ -0,0 +1,80 @@
+"""Add task full text search
+
+Revision ID: e5b9c2f4a713
+Revises: c8d3a7e1b264
+Create Date: 2026-10-18 18:21:07.443926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9c2f4a713'
+down_revision: Union[str, None] = 'c8d3a7e1b264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_UPGRADE = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, owner_id,
+        content='tasks', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description, owner_id)
+        VALUES (new.id, new.title, new.description, new.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', old.id, old.title, old.description, old.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description, owner_id
+    ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', old.id, old.title, old.description, old.owner_id);
+        INSERT INTO tasks_fts (rowid, title, description, owner_id)
+        VALUES (new.id, new.title, new.description, new.owner_id);
+    END
+    """,
+    # 既存のタスクを索引に取り込む
+    "INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')",
+)
+SQLITE_DOWNGRADE = (
+    "DROP TRIGGER IF EXISTS tasks_fts_au",
+    "DROP TRIGGER IF EXISTS tasks_fts_ad",
+    "DROP TRIGGER IF EXISTS tasks_fts_ai",
+    "DROP TABLE IF EXISTS tasks_fts",
+)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        # 大きなテーブルでは CREATE INDEX CONCURRENTLY で事前に作成しておくとよい
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_tasks_search ON tasks USING gin ("
+            "to_tsvector('simple'::regconfig, "
+            "coalesce(title, '') || ' ' || coalesce(description, '')))"
+        )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_tasks_search")
@@ -0,0 +1,55 @@
+# app/api/metrics.py
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.auth.cache import claims_cache, principal_cache
+from app.core.hashing import password_hasher
+from app.core.metrics import render_histogram, render_stats, request_metrics
+from app.db.pool import WAIT_BUCKETS
+from app.db.session import get_all_pool_stats
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render_metrics() -> str:
+    """Request metrics plus the in-process caches, password hash pool and DB pools."""
+    lines = [request_metrics.render().rstrip("\n")]
+    lines += render_stats(
+        "cache",
+        "cache",
+        {"principal": principal_cache.stats(), "claims": claims_cache.stats()},
+        counters=("hits", "misses", "evictions"),
+    )
+    lines += render_stats(
+        "password_hash",
+        "pool",
+        {"default": password_hasher.stats()},
+        counters=("completed", "rejected", "timed_out", "latency_seconds_total"),
+    )
+    pools = get_all_pool_stats()
+    wait_seconds = {name: stats.pop("wait_seconds_total") for name, stats in pools.items()}
+    lines += render_stats(
+        "db_pool",
+        "pool",
+        pools,
+        counters=("checkouts", "connects", "invalidations", "timeouts"),
+    )
+    # 待ち時間の合計はヒストグラムの _sum として出す
+    lines += render_histogram(
+        "db_pool_wait_seconds",
+        "Time spent waiting for a connection from the pool.",
+        (
+            ({"pool": name}, WAIT_BUCKETS, list(stats["wait_buckets"].values()), wait_seconds[name])
+            for name, stats in pools.items()
+        ),
+    )
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/metrics", include_in_schema=False)
+async def read_metrics() -> PlainTextResponse:
+    """Prometheus text exposition of the process metrics."""
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
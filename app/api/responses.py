@@ -0,0 +1,88 @@
+# app/api/responses.py
+
+import csv
+import io
+import json
+from operator import attrgetter
+from typing import Any, Iterable
+
+from fastapi.responses import Response
+
+from app.schemas.task import Task as TaskSchema
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# スキーマと同じキー順で出力する
+TASK_FIELDS = tuple(TaskSchema.model_fields)
+_task_values = attrgetter(*TASK_FIELDS)
+# 認証付きのため共有キャッシュには載せず、毎回 If-None-Match で再検証させる
+TASKS_CACHE_CONTROL = "private, no-cache"
+
+
+def _dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    # FastAPI の JSONResponse と同じ書式
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class TaskJSONResponse(Response):
+    """
+    Serializes task rows (or a single row) straight to JSON bytes.
+
+    Skips per-item validation into `schemas.task.Task`; the output has the same keys,
+    order and values as that schema. Return it directly from the endpoint.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, list):
+            return _dumps([dict(zip(TASK_FIELDS, _task_values(row))) for row in content])
+        return _dumps(dict(zip(TASK_FIELDS, _task_values(content))))
+
+
+def tasks_etag(owner_id: int, version: int, task_id: int | None = None) -> str:
+    """
+    Weak ETag for a view of the owner's tasks at `version` (see CRUDTask.get_version):
+    the list, or the single task `task_id`.
+    """
+    if task_id is not None:
+        return f'W/"{owner_id}.{version}.{task_id}"'
+    return f'W/"{owner_id}.{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str, wildcard: bool = True) -> bool:
+    """
+    `If-None-Match` check with weak comparison (RFC 9110 13.1.2). `*` matches only
+    with `wildcard=True`, i.e. once the caller knows the resource exists.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return wildcard
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": TASKS_CACHE_CONTROL})
+
+
+def task_ndjson_lines(rows: Iterable[Any]) -> bytes:
+    """One JSON object per line, each shaped like `schemas.task.Task`."""
+    return b"".join(_dumps(dict(zip(TASK_FIELDS, _task_values(row)))) + b"\n" for row in rows)
+
+
+def task_csv_lines(rows: Iterable[Any], header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(TASK_FIELDS)
+    writer.writerows(_task_values(row) for row in rows)
+    return buffer.getvalue().encode("utf-8")
@@ -4,10 +4,11 @@ from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.security import create_access_token, verify_password
+from app.core.hashing import password_hasher
+from app.core.security import create_access_token
 from app.db.session import get_db
 from app.schemas.token import Token
 from app.services.user import get_user_by_email
@@ -16,16 +17,25 @@ router = APIRouter()
 
 
 @router.post("/login/access-token", response_model=Token)
-def login_access_token(
-    db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
+async def login_access_token(
+    db: AsyncSession = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Token:
-    user = get_user_by_email(db, email=form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    user = await get_user_by_email(db, email=form_data.username)
+    if not user or not await password_hasher.verify(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect username or password",
         )
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    if settings.AUTH_STATELESS:
+        # 主キーと有効フラグをクレームに載せ、以降の認証でDBを引かない
+        return Token(
+            access_token=create_access_token(
+                subject=user.id,
+                expires_delta=access_token_expires,
+                claims={"email": user.email, "act": bool(user.is_active)},
+            )
+        )
     return Token(
         access_token=create_access_token(
             subject=user.email, expires_delta=access_token_expires
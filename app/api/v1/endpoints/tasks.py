@@ -1,82 +1,346 @@
 # app/api/v1/endpoints/tasks.py
 
-from typing import Any
+from datetime import datetime
+from typing import Any, AsyncIterator
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.api.responses import (
+    TASKS_CACHE_CONTROL,
+    TaskJSONResponse,
+    etag_matches,
+    not_modified,
+    task_csv_lines,
+    task_ndjson_lines,
+    tasks_etag,
+)
 from app.auth.handler import get_current_active_user
-from app.db.session import get_db
-from app.models.user import User as DBUser
-from app.schemas.task import Task, TaskCreate, TaskUpdate
-from app.services.task import create_task, delete_task, get_task, get_user_tasks, update_task
+from app.auth.principal import Principal
+from app.core.config import settings
+from app.db.session import get_read_db, get_read_session_factory, get_write_db
+from app.schemas.task import (
+    Task,
+    TaskBulkResult,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskExportFormat,
+    TaskFilter,
+    TaskImportResult,
+    TaskSort,
+    TaskStats,
+    TaskUpdate,
+)
+from app.services.task import (
+    create_task,
+    create_tasks,
+    delete_task,
+    delete_tasks,
+    get_task,
+    get_task_stats,
+    get_tasks_version,
+    get_user_tasks,
+    get_user_tasks_page,
+    next_page_cursor,
+    search_user_tasks,
+    stream_user_tasks,
+    task_exists,
+    update_task,
+    update_tasks,
+)
+from app.services.task_import import import_tasks
 
 router = APIRouter()
 
 
+def task_filter_params(
+    ids: list[int] | None = Query(None),
+    completed: bool | None = None,
+    created_before: datetime | None = None,
+) -> TaskFilter:
+    task_filter = TaskFilter(ids=ids, completed=completed, created_before=created_before)
+    if task_filter.ids is not None and len(task_filter.ids) > settings.TASK_BULK_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many ids in one request (max {settings.TASK_BULK_MAX_SIZE})",
+        )
+    return task_filter
+
+
+def task_list_filter(
+    completed: bool | None = None,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    title_prefix: str | None = Query(None, min_length=1, max_length=200),
+) -> TaskFilter:
+    return TaskFilter(
+        completed=completed,
+        created_after=created_after,
+        created_before=created_before,
+        title_prefix=title_prefix,
+    )
+
+
+def bulk_task_filter(task_filter: TaskFilter = Depends(task_filter_params)) -> TaskFilter:
+    # 条件なしの一括操作で全件を書き換えないようにする
+    if task_filter.is_empty():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one of ids, completed or created_before is required",
+        )
+    return task_filter
+
+
 @router.post("/tasks/", response_model=Task, status_code=status.HTTP_201_CREATED)
-def create_user_task(
+async def create_user_task(
     task_in: TaskCreate,
-    current_user: DBUser = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_write_db),
 ) -> Any:
-    task = create_task(db, task_in=task_in, owner_id=current_user.id)
+    task = await create_task(db, task_in=task_in, owner_id=current_user.id)
     return task
 
 
-@router.get("/tasks/", response_model=list[Task])
-def read_user_tasks(
-    db: Session = Depends(get_db),
+@router.post(
+    "/tasks/bulk",
+    response_model=list[Task],
+    response_class=TaskJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_user_tasks_bulk(
+    tasks_in: list[TaskCreate],
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_write_db),
+) -> Any:
+    if len(tasks_in) > settings.TASK_BULK_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many tasks in one request (max {settings.TASK_BULK_MAX_SIZE})",
+        )
+    tasks = await create_tasks(db, tasks_in=tasks_in, owner_id=current_user.id)
+    return TaskJSONResponse(tasks, status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/tasks/", response_model=list[Task], response_class=TaskJSONResponse)
+async def read_user_tasks(
+    db: AsyncSession = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
-    current_user: DBUser = Depends(get_current_active_user),
+    cursor: str | None = None,
+    task_filter: TaskFilter = Depends(task_list_filter),
+    sort: TaskSort = TaskSort.id,
+    if_none_match: str | None = Header(None),
+    current_user: Principal = Depends(get_current_active_user),
+) -> Any:
+    """
+    List the current user's tasks, optionally filtered by `completed`, creation
+    time (`created_after` inclusive, `created_before` exclusive) and a
+    case-sensitive `title_prefix`, ordered by `sort` (`id`, `created_at`, or
+    either prefixed with `-` for descending).
+
+    Pass the `X-Next-Cursor` response header back as `cursor`, with the same
+    filters and sort, to fetch the next page by keyset instead of `skip`; the
+    header is absent on the last page.
+    Send the `ETag` back as `If-None-Match` to get 304 while nothing changed.
+    """
+    # バージョンはタスクより先に読む（間に更新が入っても古いETagになるだけで安全）
+    etag = tasks_etag(current_user.id, await get_tasks_version(db, owner_id=current_user.id))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    if cursor is not None:
+        try:
+            tasks, next_cursor = await get_user_tasks_page(
+                db,
+                owner_id=current_user.id,
+                cursor=cursor,
+                limit=limit,
+                task_filter=task_filter,
+                sort=sort,
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    else:
+        tasks = await get_user_tasks(
+            db,
+            owner_id=current_user.id,
+            skip=skip,
+            limit=limit,
+            task_filter=task_filter,
+            sort=sort,
+        )
+        next_cursor = next_page_cursor(tasks, limit, sort)
+    response = TaskJSONResponse(
+        tasks, headers={"ETag": etag, "Cache-Control": TASKS_CACHE_CONTROL}
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
+
+@router.patch("/tasks/", response_model=TaskBulkResult)
+async def update_user_tasks_bulk(
+    task_in: TaskBulkUpdate,
+    task_filter: TaskFilter = Depends(bulk_task_filter),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_write_db),
+) -> Any:
+    if not task_in.model_fields_set:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update")
+    count = await update_tasks(
+        db, owner_id=current_user.id, task_filter=task_filter, task_in=task_in
+    )
+    return TaskBulkResult(count=count)
+
+
+@router.delete("/tasks/", response_model=TaskBulkResult)
+async def delete_user_tasks_bulk(
+    task_filter: TaskFilter = Depends(bulk_task_filter),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_write_db),
+) -> Any:
+    count = await delete_tasks(db, owner_id=current_user.id, task_filter=task_filter)
+    return TaskBulkResult(count=count)
+
+
+@router.get("/tasks/export")
+async def export_user_tasks(
+    export_format: TaskExportFormat = Query(TaskExportFormat.ndjson, alias="format"),
+    current_user: Principal = Depends(get_current_active_user),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_read_session_factory),
+) -> StreamingResponse:
+    """
+    Stream all of the current user's tasks as NDJSON (default) or CSV.
+
+    Rows are read in batches of TASK_EXPORT_BATCH_SIZE, so memory stays flat
+    regardless of how many tasks the account has.
+    """
+    batches = stream_user_tasks(
+        session_factory, owner_id=current_user.id, batch_size=settings.TASK_EXPORT_BATCH_SIZE
+    )
+    if export_format is TaskExportFormat.csv:
+        return StreamingResponse(
+            _csv_body(batches),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": 'attachment; filename="tasks.csv"'},
+        )
+    return StreamingResponse(
+        (task_ndjson_lines(batch) async for batch in batches),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="tasks.ndjson"'},
+    )
+
+
+async def _csv_body(batches: AsyncIterator) -> AsyncIterator[bytes]:
+    yield task_csv_lines([], header=True)
+    async for batch in batches:
+        yield task_csv_lines(batch)
+
+
+@router.post("/tasks/import", response_model=TaskImportResult)
+async def import_user_tasks(
+    request: Request,
+    import_format: TaskExportFormat = Query(TaskExportFormat.ndjson, alias="format"),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_write_db),
 ) -> Any:
-    tasks = get_user_tasks(db, owner_id=current_user.id, skip=skip, limit=limit)
-    return tasks
+    """
+    Import tasks from an NDJSON (default) or CSV request body, e.g. a previous export.
+
+    The body is read incrementally and valid lines are inserted in batches of
+    TASK_IMPORT_BATCH_SIZE, each committed on its own; invalid lines are skipped and
+    reported by line number. Batches committed before a failure are kept.
+    """
+    return await import_tasks(
+        db, owner_id=current_user.id, chunks=request.stream(), fmt=import_format
+    )
+
+
+@router.get("/tasks/search", response_model=list[Task], response_class=TaskJSONResponse)
+async def search_user_tasks_by_text(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db),
+) -> Any:
+    """
+    Full-text search over the current user's task titles and descriptions.
+
+    Every word in `q` must match; results are ranked (title matches first) and
+    paginated with `skip`/`limit`.
+    """
+    tasks = await search_user_tasks(db, owner_id=current_user.id, query=q, skip=skip, limit=limit)
+    return TaskJSONResponse(tasks)
 
 
-@router.get("/tasks/{task_id}", response_model=Task)
-def read_task_by_id(
+@router.get("/tasks/stats", response_model=TaskStats)
+async def read_user_task_stats(
+    days: int = Query(30, ge=1, le=366),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db),
+) -> Any:
+    """
+    Total, completed and open task counts, plus the number of existing tasks created
+    on each of the last `days` days (UTC; days without tasks are omitted).
+
+    Served from counters maintained on every write, so the cost does not grow with
+    the number of tasks.
+    """
+    return await get_task_stats(db, owner_id=current_user.id, days=days)
+
+
+@router.get("/tasks/{task_id}", response_model=Task, response_class=TaskJSONResponse)
+async def read_task_by_id(
     task_id: int,
-    current_user: DBUser = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(None),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Any:
-    task = get_task(db, task_id=task_id)
+    # ETagはこのタスクを返したときにだけ発行される。それ以降このユーザーのタスクが
+    # 一切変わっていなければ、タスクはまだ存在し本人のものなので、読まずに304を返せる
+    version = await get_tasks_version(db, owner_id=current_user.id)
+    etag = tasks_etag(current_user.id, version, task_id=task_id)
+    if etag_matches(if_none_match, etag, wildcard=False):
+        return not_modified(etag)
+    task = await get_task(db, task_id=task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     if task.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to access this task")
-    return task
+    # `*` は存在するタスクにだけ一致する
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return TaskJSONResponse(task, headers={"ETag": etag, "Cache-Control": TASKS_CACHE_CONTROL})
 
 
 @router.put("/tasks/{task_id}", response_model=Task)
-def update_user_task(
+async def update_user_task(
     task_id: int,
     task_in: TaskUpdate,
-    current_user: DBUser = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_write_db),
 ) -> Any:
-    db_task = get_task(db, task_id=task_id)
-    if not db_task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    if db_task.owner_id != current_user.id:
+    task = await update_task(db, task_id=task_id, owner_id=current_user.id, task_in=task_in)
+    if not task:
+        # 更新対象がなかった場合のみ、存在しないのか他人のタスクなのかを確認する
+        if not await task_exists(db, task_id=task_id):
+            raise HTTPException(status_code=404, detail="Task not found")
         raise HTTPException(status_code=403, detail="Not authorized to update this task")
-    task = update_task(db, db_task=db_task, task_in=task_in)
     return task
 
 
 @router.delete("/tasks/{task_id}", response_model=Task)
-def delete_user_task(
+async def delete_user_task(
     task_id: int,
-    current_user: DBUser = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_write_db),
 ) -> Any:
-    db_task = get_task(db, task_id=task_id)
-    if not db_task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    if db_task.owner_id != current_user.id:
+    task = await delete_task(db, task_id=task_id, owner_id=current_user.id)
+    if not task:
+        if not await task_exists(db, task_id=task_id):
+            raise HTTPException(status_code=404, detail="Task not found")
         raise HTTPException(status_code=403, detail="Not authorized to delete this task")
-    task = delete_task(db, task_id=task_id)
     return task
 
 
@@ -0,0 +1,22 @@
+# app/auth/cache.py
+
+from typing import Any
+
+from app.auth.principal import Principal
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.user import User
+
+# トークンのsubject -> Principal。ユーザー更新時に無効化し、他プロセスでの更新はTTLで反映される
+principal_cache: TTLCache[str, Principal] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+# sha256(トークン) -> 検証済みクレーム
+claims_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+    maxsize=settings.JWT_CLAIMS_CACHE_SIZE, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
+
+def invalidate_principal(user: User) -> None:
+    principal_cache.pop(user.email)
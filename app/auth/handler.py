@@ -1,45 +1,99 @@
 # app/auth/handler.py
 
+import hashlib
+import time
+from typing import Any
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.cache import claims_cache, principal_cache
+from app.auth.principal import Principal
+from app.auth.revocation import revocation_list
 from app.core.config import settings
 
 from app.crud.user import user as crud_user
 from app.db.session import get_db
-from app.models.user import User
-from app.schemas.token import TokenData
+from app.schemas.token import StatelessTokenData, TokenData
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/login/access-token")
 
 
+def decode_access_token(token: str) -> dict[str, Any]:
+    """
+    Verify `token` and return its claims, reusing earlier verifications of the same token.
+
+    Raises JWTError if the token is invalid or expired.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    claims = claims_cache.get(key)
+    if claims is not None:
+        return claims
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        # 有効期限を過ぎたトークンをキャッシュから返さないよう、TTLはexpまでに制限する
+        ttl = min(exp - time.time(), claims_cache.ttl)
+        if ttl > 0:
+            claims_cache.set(key, claims, ttl=ttl)
+    return claims
+
+
 async def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
+    db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email)
+        payload = decode_access_token(token)
     except JWTError:
         raise credentials_exception
-    user = crud_user.get_by_email(db, email=token_data.email)
-    if user is None:
+    if settings.AUTH_STATELESS and "act" in payload:
+        return await _principal_from_claims(db, payload, credentials_exception)
+    email: str = payload.get("sub")
+    if email is None:
+        raise credentials_exception
+    token_data = TokenData(email=email)
+    principal = principal_cache.get(token_data.email)
+    if principal is None:
+        user = await crud_user.get_by_email(db, email=token_data.email)
+        if user is None:
+            raise credentials_exception
+        principal = Principal.from_user(user)
+        principal_cache.set(token_data.email, principal)
+    return principal
+
+
+async def _principal_from_claims(
+    db: AsyncSession, payload: dict[str, Any], credentials_exception: HTTPException
+) -> Principal:
+    # DBは参照せず、無効化・削除は定期的に同期するリストで判定する
+    try:
+        token_data = StatelessTokenData(**payload)
+    except ValidationError:
+        raise credentials_exception
+    if revocation_list.claim_refresh():
+        revocation_list.load(
+            await crud_user.get_inactive_ids(db, limit=revocation_list.max_entries + 1)
+        )
+    if revocation_list.is_deleted(token_data.sub):
         raise credentials_exception
-    return user
+    return Principal(
+        id=token_data.sub,
+        email=token_data.email,
+        is_active=token_data.act and not revocation_list.is_inactive(token_data.sub),
+    )
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
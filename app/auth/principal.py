@@ -0,0 +1,18 @@
+# app/auth/principal.py
+
+from dataclasses import dataclass
+
+from app.models.user import User
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Lightweight snapshot of the authenticated user, detached from any DB session."""
+
+    id: int
+    email: str
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, email=user.email, is_active=bool(user.is_active))
@@ -0,0 +1,79 @@
+# app/auth/revocation.py
+
+import logging
+import time
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """
+    In-memory set of user ids whose stateless tokens must be rejected.
+
+    The set of inactive users is reloaded from the DB at most once per `refresh_interval`,
+    so deactivations made by other processes are picked up within that window. Changes
+    made in this process apply immediately. Deleted users no longer appear in the DB, so
+    they are remembered only for as long as one of their tokens can still be valid.
+
+    Args:
+        refresh_interval: Seconds between reloads of inactive users
+        max_entries: Upper bound on the number of ids kept in memory
+    """
+
+    def __init__(self, refresh_interval: float, max_entries: int):
+        self.refresh_interval = refresh_interval
+        self.max_entries = max_entries
+        self._inactive: frozenset[int] = frozenset()
+        self._deleted: TTLCache[int, bool] = TTLCache(
+            maxsize=max_entries, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        )
+        self._next_refresh = 0.0
+        self.refreshes = 0
+
+    def is_inactive(self, user_id: int) -> bool:
+        return user_id in self._inactive
+
+    def is_deleted(self, user_id: int) -> bool:
+        return self._deleted.get(user_id) is not None
+
+    def deactivate(self, user_id: int) -> None:
+        self._inactive = self._inactive | {user_id}
+
+    def restore(self, user_id: int) -> None:
+        self._inactive = self._inactive - {user_id}
+
+    def delete(self, user_id: int) -> None:
+        self._deleted.set(user_id, True)
+
+    def claim_refresh(self) -> bool:
+        """Return True if the caller should reload inactive users now."""
+        now = time.monotonic()
+        if now < self._next_refresh:
+            return False
+        # 同時リクエストで再取得が重ならないよう、先に次回時刻を進める
+        self._next_refresh = now + self.refresh_interval
+        return True
+
+    def load(self, inactive: list[int]) -> None:
+        """Replace the DB-backed set; pass up to `max_entries + 1` ids to detect truncation."""
+        if len(inactive) > self.max_entries:
+            logger.warning(
+                "More than %d inactive users; revocation list is truncated", self.max_entries
+            )
+            inactive = inactive[: self.max_entries]
+        self._inactive = frozenset(inactive)
+        self.refreshes += 1
+
+    def clear(self) -> None:
+        self._inactive = frozenset()
+        self._deleted.clear()
+        self._next_refresh = 0.0
+
+
+revocation_list = RevocationList(
+    refresh_interval=settings.REVOCATION_REFRESH_SECONDS,
+    max_entries=settings.REVOCATION_MAX_ENTRIES,
+)
@@ -0,0 +1,51 @@
+# app/commands/task_stats.py
+"""
+Check or repair the per-user task counters behind GET /tasks/stats.
+
+Usage:
+    python -m app.commands.task_stats verify [--owner-id ID]
+    python -m app.commands.task_stats rebuild [--owner-id ID]
+
+`verify` recounts the tasks table, prints every mismatch and exits with status 1
+if there is any drift. `rebuild` overwrites the counters with the recount.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.crud.task import task as crud_task
+from app.db.session import AsyncSessionLocal, async_engine
+from app.models import user  # noqa: F401  Task.owner のリレーション解決に必要
+
+
+async def verify(owner_id: int | None) -> int:
+    async with AsyncSessionLocal() as db:
+        drift = await crud_task.find_stats_drift(db, owner_id=owner_id)
+    for drift_owner, counter, stored, actual in drift:
+        print(f"owner {drift_owner}: {counter} stored={stored} actual={actual}")
+    print(f"{len(drift)} mismatches")
+    return 1 if drift else 0
+
+
+async def rebuild(owner_id: int | None) -> int:
+    async with AsyncSessionLocal() as db:
+        await crud_task.rebuild_stats(db, owner_id=owner_id)
+        drift = await crud_task.find_stats_drift(db, owner_id=owner_id)
+    print("rebuilt" if not drift else f"{len(drift)} mismatches remain (concurrent writes?)")
+    return 1 if drift else 0
+
+
+async def main(command: str, owner_id: int | None) -> int:
+    try:
+        return await {"verify": verify, "rebuild": rebuild}[command](owner_id)
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("command", choices=["verify", "rebuild"])
+    parser.add_argument("--owner-id", type=int, default=None)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.command, args.owner_id)))
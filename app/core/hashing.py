@@ -0,0 +1,110 @@
+# app/core/hashing.py
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+
+class PasswordHashPoolBusy(Exception):
+    """Raised when the hashing pool is saturated or a job waited longer than allowed."""
+
+
+class PasswordHashPool:
+    """
+    Runs bcrypt hashing/verification on a dedicated, size-limited executor.
+
+    Jobs beyond `workers + max_queue` in flight are rejected immediately, and a queued job
+    that does not finish within `timeout` seconds is cancelled, so a login burst cannot
+    take over the event loop or the default threadpool.
+
+    Args:
+        workers: Number of worker threads/processes
+        use_processes: Use a process pool so hashing escapes the GIL
+        max_queue: Jobs allowed to wait for a free worker
+        timeout: Seconds a job may take, queueing included
+    """
+
+    def __init__(self, workers: int, use_processes: bool, max_queue: int, timeout: float):
+        self.workers = workers
+        self.use_processes = use_processes
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor: Executor | None = None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.latency_seconds_total = 0.0
+        self.latency_seconds_max = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self.in_flight - self.workers, 0)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHashPoolBusy("Password hashing pool is saturated")
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+            # タイムアウト時はキャンセルされ、未着手のジョブはキューから取り除かれる
+            result = await asyncio.wait_for(future, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise PasswordHashPoolBusy("Password hashing timed out in the queue")
+        finally:
+            self.in_flight -= 1
+        elapsed = time.perf_counter() - started
+        self.completed += 1
+        self.latency_seconds_total += elapsed
+        self.latency_seconds_max = max(self.latency_seconds_max, elapsed)
+        return result
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "latency_seconds_total": self.latency_seconds_total,
+            "latency_seconds_max": self.latency_seconds_max,
+        }
+
+
+password_hasher = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    use_processes=settings.PASSWORD_HASH_USE_PROCESSES,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,254 @@
+# app/core/metrics.py
+
+import bisect
+import threading
+import time
+from typing import Any, Iterable, Mapping
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_stats import track_queries
+
+# Prometheus クライアントの既定と同じ境界（秒）
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Mapping[str, str]
+
+
+class Histogram:
+    """Fixed-bucket histogram; not thread-safe on its own (RequestMetrics holds the lock)."""
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 最後は +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class RequestMetrics:
+    """
+    Per-route request counts, latency histograms and database usage.
+
+    Routes are labelled with their path template (e.g. /api/v1/tasks/{task_id}),
+    never the raw path, so the number of series stays bounded.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._requests: dict[tuple[str, str, str], int] = {}
+        self._latency: dict[tuple[str, str], Histogram] = {}
+        self._db_queries: dict[tuple[str, str], int] = {}
+        self._db_seconds: dict[tuple[str, str], float] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        queries: int = 0,
+        db_seconds: float = 0.0,
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            status_key = (method, route, str(status))
+            self._requests[status_key] = self._requests.get(status_key, 0) + 1
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+            self._db_queries[key] = self._db_queries.get(key, 0) + queries
+            self._db_seconds[key] = self._db_seconds.get(key, 0.0) + db_seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._latency.clear()
+            self._db_queries.clear()
+            self._db_seconds.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            requests = sorted(self._requests.items())
+            latency = sorted(
+                (key, (histogram.counts.copy(), histogram.sum))
+                for key, histogram in self._latency.items()
+            )
+            db_queries = sorted(self._db_queries.items())
+            db_seconds = sorted(self._db_seconds.items())
+
+        def route_labels(method: str, route: str) -> dict[str, str]:
+            return {"method": method, "route": route}
+
+        lines = render_family(
+            "http_requests_total",
+            "counter",
+            "HTTP requests by route and status code.",
+            (
+                ({**route_labels(method, route), "status": status}, count)
+                for (method, route, status), count in requests
+            ),
+        )
+        lines += render_histogram(
+            "http_request_duration_seconds",
+            "Time from receiving the request until the response was sent.",
+            (
+                (route_labels(*key), self.buckets, counts, total)
+                for key, (counts, total) in latency
+            ),
+        )
+        lines += render_family(
+            "http_request_db_queries_total",
+            "counter",
+            "SQL statements executed while handling requests.",
+            ((route_labels(*key), count) for key, count in db_queries),
+        )
+        lines += render_family(
+            "http_request_db_seconds_total",
+            "counter",
+            "Time spent executing SQL statements while handling requests.",
+            ((route_labels(*key), seconds) for key, seconds in db_seconds),
+        )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _sample(name: str, labels: Labels, value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+        name = f"{name}{{{rendered}}}"
+    if value == float("inf"):
+        return f"{name} +Inf"
+    return f"{name} {value!r}" if isinstance(value, float) else f"{name} {int(value)}"
+
+
+def render_family(
+    name: str, kind: str, help_text: str, samples: Iterable[tuple[Labels, float]]
+) -> list[str]:
+    """`# HELP` / `# TYPE` lines followed by one line per sample (Prometheus text format)."""
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"] + [
+        _sample(name, labels, value) for labels, value in samples
+    ]
+
+
+def render_histogram(
+    name: str,
+    help_text: str,
+    series: Iterable[tuple[Labels, Iterable[float], list[int], float]],
+) -> list[str]:
+    """
+    Render histograms from (labels, bucket bounds, per-bucket counts, sum).
+
+    `counts` holds one count per bound plus the +Inf bucket, not cumulative.
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for labels, bounds, counts, total in series:
+        cumulative = 0
+        for bound, count in zip((*bounds, float("inf")), counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else f"{bound:g}"
+            lines.append(_sample(f"{name}_bucket", {**labels, "le": le}, cumulative))
+        lines.append(_sample(f"{name}_sum", labels, float(total)))
+        lines.append(_sample(f"{name}_count", labels, cumulative))
+    return lines
+
+
+def render_stats(
+    prefix: str,
+    label: str,
+    stats_by_label: Mapping[str, Mapping[str, Any]],
+    counters: Iterable[str] = (),
+) -> list[str]:
+    """
+    Render `stats()` dicts (caches, pools, ...) as gauges, or counters for the
+    keys in `counters`; one series per entry of `stats_by_label`. Non-numeric
+    values are skipped.
+    """
+    counters = set(counters)
+    families: dict[str, list[tuple[Labels, float]]] = {}
+    for label_value, stats in stats_by_label.items():
+        for key, value in stats.items():
+            if isinstance(value, (int, float)):
+                families.setdefault(key, []).append(({label: label_value}, value))
+    lines: list[str] = []
+    for key, samples in families.items():
+        if key in counters:
+            name = f"{prefix}_{key.removesuffix('_total')}_total"
+            lines += [f"# TYPE {name} counter"] + [_sample(name, *sample) for sample in samples]
+        else:
+            name = f"{prefix}_{key}"
+            lines += [f"# TYPE {name} gauge"] + [_sample(name, *sample) for sample in samples]
+    return lines
+
+
+# ラベルの値がクライアント次第で増え続けないよう、これ以外のメソッドは "other" にまとめる
+KNOWN_METHODS = frozenset(
+    ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "CONNECT", "TRACE")
+)
+
+
+def _method_label(method: str) -> str:
+    return method if method in KNOWN_METHODS else "other"
+
+
+def _route_template(scope: Scope, status: int) -> str:
+    # FastAPI の APIRoute は一致したルートを scope に残す。それ以外（/docs 等）は探し直す
+    route = scope.get("route")
+    if route is None and status != 404:
+        router = scope.get("router")
+        for candidate in getattr(router, "routes", ()):
+            if candidate.matches(scope)[0] is Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status and SQL usage of every HTTP request
+    into a RequestMetrics (queries are counted via app.db.query_stats).
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        with track_queries(endpoint=f"{scope['method']} {scope['path']}") as queries:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                # 例外時はこの外側の ServerErrorMiddleware が 500 を返す
+                self.metrics.observe(
+                    _method_label(scope["method"]),
+                    _route_template(scope, status),
+                    status,
+                    time.perf_counter() - started,
+                    queries.count,
+                    queries.seconds,
+                )
+
+
+request_metrics = RequestMetrics()
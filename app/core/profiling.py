@@ -0,0 +1,61 @@
+# app/core/profiling.py
+
+import logging
+from collections import Counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.db.query_stats import QueryStats, track_queries
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Time"
+
+
+def repeated_statements(stats: QueryStats, threshold: int) -> list[tuple[str, int]]:
+    """Statements executed at least `threshold` times, most repeated first."""
+    counts = Counter(statement for statement, _ in stats.statements or ())
+    return [(statement, n) for statement, n in counts.most_common() if n >= threshold]
+
+
+class QueryProfilerMiddleware:
+    """
+    While DB_PROFILING is on, collects every SQL statement of a request.
+
+    Adds X-DB-Query-Count and X-DB-Time (milliseconds) to the response (statements
+    issued while a streaming body is sent come after the headers and are not
+    included) and logs statements repeated DB_N_PLUS_ONE_THRESHOLD times or more
+    as a likely N+1. Does nothing per request while profiling is off.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.DB_PROFILING:
+            await self.app(scope, receive, send)
+            return
+        endpoint = f"{scope['method']} {scope['path']}"
+
+        with track_queries(collect=True, endpoint=endpoint) as queries:
+
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers[QUERY_COUNT_HEADER] = str(queries.count)
+                    headers[QUERY_TIME_HEADER] = f"{queries.seconds * 1000:.3f}"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                for statement, n in repeated_statements(queries, settings.DB_N_PLUS_ONE_THRESHOLD):
+                    logger.warning(
+                        "Possible N+1 in %s: statement executed %d times: %s",
+                        endpoint,
+                        n,
+                        statement,
+                    )
@@ -3,7 +3,8 @@
 from typing import Any, Generic, Type, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base import Base
 
@@ -15,47 +16,50 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
         """
-        CRUD object with default methods to Create, Read, Update, Delete (CRUD).
+        CRUD object with default async methods to Create, Read, Update, Delete (CRUD).
 
         Args:
             model: A SQLAlchemy model class
         """
         self.model = model
+        self._columns = frozenset(model.__table__.columns.keys())
 
-    def get(self, db: Session, id: Any) -> ModelType | None:
-        return db.query(self.model).filter(self.model.id == id).first()
+    async def get(self, db: AsyncSession, id: Any) -> ModelType | None:
+        return await db.get(self.model, id)
 
-    def get_multi(self, db: Session, skip: int = 0, limit: int = 100) -> list[ModelType]:
-        return db.query(self.model).offset(skip).limit(limit).all()
+    async def get_multi(
+        self, db: AsyncSession, skip: int = 0, limit: int = 100
+    ) -> list[ModelType]:
+        result = await db.scalars(select(self.model).offset(skip).limit(limit))
+        return list(result)
 
-    def create(self, db: Session, obj_in: CreateSchemaType) -> ModelType:
+    async def create(self, db: AsyncSession, obj_in: CreateSchemaType) -> ModelType:
+        # id/created_at は INSERT ... RETURNING で取得済み（eager_defaults）なので refresh は不要
         db_obj = self.model(**obj_in.model_dump())
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
         return db_obj
 
-    def update(
-        self, db: Session, db_obj: ModelType, obj_in: UpdateSchemaType | dict[str, Any]
+    async def update(
+        self,
+        db: AsyncSession,
+        db_obj: ModelType,
+        obj_in: UpdateSchemaType | dict[str, Any],
     ) -> ModelType:
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
-        for field in db_obj.__dict__:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        for field, value in update_data.items():
+            if field in self._columns:
+                setattr(db_obj, field, value)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
         return db_obj
 
-    def remove(self, db: Session, id: int) -> ModelType | None:
-        obj = db.query(self.model).get(id)
+    async def remove(self, db: AsyncSession, id: int) -> ModelType | None:
+        obj = await db.get(self.model, id)
         if obj:
-            db.delete(obj)
-            db.commit()
+            await db.delete(obj)
+            await db.commit()
         return obj
-
-
-
@@ -1,35 +1,611 @@
 # app/crud/task.py
 
-from sqlalchemy.orm import Session
+import sys
+from collections import Counter
+from datetime import date, datetime, timezone
+from operator import attrgetter
+from typing import Any, AsyncIterator, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    DateTime,
+    Row,
+    Select,
+    String,
+    TypeDecorator,
+    bindparam,
+    case,
+    column,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    table,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
+from app.db.search import (
+    SQLITE_FTS_TABLE,
+    SQLITE_RANK,
+    postgres_search_query,
+    postgres_search_vector,
+    search_terms,
+    sqlite_match,
+)
 from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.models.task_counter import TaskCounter, TaskDailyCount
+from app.schemas.task import Task as TaskSchema
+from app.schemas.task import TaskCreate, TaskFilter, TaskSort, TaskUpdate
+
+tasks_table = Task.__table__
+# レスポンス（schemas.task.Task）に必要な列だけを読む
+TASK_ROW_COLUMNS = tuple(tasks_table.c[name] for name in TaskSchema.model_fields)
+TaskRow = Row[tuple[str, str | None, int, bool, int]]
+
+task_counters = TaskCounter.__table__
+task_daily_counts = TaskDailyCount.__table__
+
+# INSERT ... ON CONFLICT DO UPDATE はダイアレクトごとの insert() でしか組み立てられない
+_UPSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class _CreatedAtParam(TypeDecorator):
+    """
+    Bind type for values compared with tasks.created_at.
+
+    On SQLite the column holds text; CURRENT_TIMESTAMP (its default) writes
+    "YYYY-MM-DD HH:MM:SS" without microseconds, while DateTime binds always add
+    ".000000", so a bound value equal to a stored one compared as greater.
+    Binds the same text instead. On every dialect aware datetimes are converted
+    to naive UTC, as the column is "timestamp without time zone".
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        return dialect.type_descriptor(String() if dialect.name == "sqlite" else DateTime())
+
+    def process_bind_param(self, value: datetime | None, dialect) -> Any:
+        if value is None:
+            return value
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return str(value) if dialect.name == "sqlite" else value
+
+
+def _created_at(value: datetime | None) -> ColumnElement:
+    return literal(value, _CreatedAtParam())
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """The smallest string above every string starting with `prefix`, or None if unbounded."""
+    # 最後の文字を1つ進める（これ以上進められない文字は切り詰める）
+    stripped = prefix.rstrip(chr(sys.maxunicode))
+    if not stripped:
+        return None
+    # サロゲートの範囲（UTF-8 で送れない）は飛ばす
+    last = ord(stripped[-1]) + 1
+    return stripped[:-1] + chr(0xE000 if 0xD800 <= last < 0xE000 else last)
 
 
 class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
-    def get_tasks_by_owner(
-        self, db: Session, owner_id: int, skip: int = 0, limit: int = 100
+    async def get_tasks_by_owner(
+        self, db: AsyncSession, owner_id: int, skip: int = 0, limit: int = 100
     ) -> list[Task]:
-        return (
-            db.query(Task)
-            .filter(Task.owner_id == owner_id)
+        result = await db.scalars(
+            select(Task)
+            .where(Task.owner_id == owner_id)
+            .order_by(Task.id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(result)
+
+    async def get_tasks_by_owner_after(
+        self, db: AsyncSession, owner_id: int, after_id: int | None = None, limit: int = 100
+    ) -> list[Task]:
+        """Keyset page: seeks on (owner_id, id) instead of skipping rows with OFFSET."""
+        query = select(Task).where(Task.owner_id == owner_id)
+        if after_id is not None:
+            query = query.where(Task.id > after_id)
+        result = await db.scalars(query.order_by(Task.id).limit(limit))
+        return list(result)
+
+    async def get_rows_by_owner(
+        self,
+        db: AsyncSession,
+        owner_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        task_filter: TaskFilter | None = None,
+        sort: TaskSort = TaskSort.id,
+    ) -> Sequence[TaskRow]:
+        """Read-only variant of `get_tasks_by_owner` returning plain rows (no ORM state)."""
+        query = self._rows_query(owner_id, task_filter, sort)
+        return await self._fetch_rows(db, query.offset(skip).limit(limit))
+
+    async def get_rows_by_owner_after(
+        self,
+        db: AsyncSession,
+        owner_id: int,
+        after_id: int | None = None,
+        limit: int = 100,
+        task_filter: TaskFilter | None = None,
+        sort: TaskSort = TaskSort.id,
+        after_created_at: datetime | None = None,
+    ) -> Sequence[TaskRow]:
+        """
+        Read-only variant of `get_tasks_by_owner_after` returning plain rows.
+
+        With a created_at sort the position is (`after_created_at`, `after_id`),
+        the sort key of the last row of the previous page.
+        """
+        query = self._rows_query(owner_id, task_filter, sort)
+        if after_id is not None:
+            if sort.key == "created_at":
+                position = tuple_(_created_at(after_created_at), literal(after_id))
+                keys = tuple_(tasks_table.c.created_at, tasks_table.c.id)
+            else:
+                position, keys = literal(after_id), tasks_table.c.id
+            query = query.where(keys < position if sort.descending else keys > position)
+        return await self._fetch_rows(db, query.limit(limit))
+
+    async def stream_rows_by_owner(
+        self, db: AsyncSession, owner_id: int, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[TaskRow]]:
+        """Yield all of the owner's task rows in batches from a server-side cursor."""
+        connection = await db.connection()
+        result = await connection.stream(
+            self._rows_query(owner_id).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            yield partition
+
+    async def search_rows_by_owner(
+        self, db: AsyncSession, owner_id: int, query: str, skip: int = 0, limit: int = 20
+    ) -> Sequence[TaskRow]:
+        """
+        Full-text search over title and description, best matches first.
+
+        Every word of `query` must match; uses FTS5 on SQLite and the GIN
+        expression index on PostgreSQL (see app.db.search).
+        """
+        terms = search_terms(query)
+        if not terms:
+            return []
+        connection = await db.connection()
+        search = select(*TASK_ROW_COLUMNS).where(tasks_table.c.owner_id == owner_id)
+        if connection.dialect.name == "postgresql":
+            vector, tsquery = postgres_search_vector(), postgres_search_query(terms)
+            search = search.where(vector.op("@@")(tsquery)).order_by(
+                func.ts_rank(vector, tsquery).desc(), tasks_table.c.id
+            )
+        else:
+            fts = table(SQLITE_FTS_TABLE, column("rowid"))
+            search = (
+                search.join_from(tasks_table, fts, fts.c.rowid == tasks_table.c.id)
+                .where(literal_column(SQLITE_FTS_TABLE).op("MATCH")(sqlite_match(owner_id, terms)))
+                .order_by(literal_column(SQLITE_RANK), tasks_table.c.id)
+            )
+        result = await connection.execute(search.offset(skip).limit(limit))
+        return result.all()
+
+    @classmethod
+    def _rows_query(
+        cls, owner_id: int, task_filter: TaskFilter | None = None, sort: TaskSort = TaskSort.id
+    ) -> Select:
+        # 並び順は常に一意になるよう id を最後のキーにする。
+        # 絞り込みと並び順の組み合わせごとに、同じ列順のインデックスがある（models.task）
+        if sort.key == "created_at":
+            keys = (tasks_table.c.created_at, tasks_table.c.id)
+        else:
+            keys = (tasks_table.c.id,)
+        columns = TASK_ROW_COLUMNS + tuple(
+            key for key in keys if key.name not in TaskSchema.model_fields
+        )
+        return (
+            select(*columns)
+            .where(*cls._filter_clauses(owner_id, task_filter or TaskFilter()))
+            .order_by(*(key.desc() if sort.descending else key for key in keys))
+        )
+
+    @staticmethod
+    async def _fetch_rows(db: AsyncSession, query: Select) -> Sequence[TaskRow]:
+        # ORMを経由せずCoreで実行し、identity map や変更追跡のコストを避ける
+        connection = await db.connection()
+        result = await connection.execute(query)
+        return result.all()
 
-    def create_with_owner(
-        self, db: Session, obj_in: TaskCreate, owner_id: int
+    async def create_with_owner(
+        self, db: AsyncSession, obj_in: TaskCreate, owner_id: int
     ) -> Task:
         db_obj = Task(**obj_in.model_dump(), owner_id=owner_id)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await self._record_created(db, owner_id, count=1)
+        await db.commit()
         return db_obj
 
+    async def create_many_with_owner(
+        self, db: AsyncSession, objs_in: list[TaskCreate], owner_id: int
+    ) -> list[Task]:
+        """Insert all tasks with one multi-row INSERT ... RETURNING and a single commit."""
+        if not objs_in:
+            return []
+        result = await db.scalars(
+            insert(Task).returning(Task),
+            [{**obj_in.model_dump(), "owner_id": owner_id} for obj_in in objs_in],
+        )
+        # 複数行RETURNINGの返却順は保証されないが、idは入力順に採番される
+        db_objs = sorted(result, key=attrgetter("id"))
+        await self._record_created(db, owner_id, count=len(db_objs))
+        await db.commit()
+        return db_objs
 
-task = CRUDTask(Task)
+    async def insert_many_with_owner(
+        self, db: AsyncSession, objs_in: list[TaskCreate], owner_id: int
+    ) -> int:
+        """
+        Insert tasks in one executemany without RETURNING or ORM objects and commit.
 
+        For imports where the created rows are not sent back; returns the row count.
+        """
+        if not objs_in:
+            return 0
+        connection = await db.connection()
+        await connection.execute(
+            insert(tasks_table),
+            [{**obj_in.model_dump(), "owner_id": owner_id} for obj_in in objs_in],
+        )
+        await self._record_created(db, owner_id, count=len(objs_in))
+        await db.commit()
+        return len(objs_in)
+
+    async def update_owned(
+        self, db: AsyncSession, id: int, owner_id: int, obj_in: TaskUpdate
+    ) -> Task | None:
+        """
+        Update the task in one owner-scoped UPDATE ... RETURNING.
 
+        Returns None if the task does not exist or belongs to someone else.
+        """
+        values = obj_in.model_dump(exclude_unset=True)
+        clauses = [Task.id == id, Task.owner_id == owner_id]
+        if "completed" in values:
+            # 完了数の差分は更新前の値から求めるため、カウンタを先に更新する（対象がなければ何もしない）
+            await self._lock_rows(db, clauses)
+            await self._update_counters(
+                db,
+                owner_id,
+                completed=self._completed_delta(clauses, values["completed"]),
+                matching=clauses,
+            )
+        result = await db.scalars(
+            update(Task).where(*clauses).values(**values).returning(Task),
+            # 同じセッションに読み込み済みのインスタンスがあれば、追加のSQLなしで値を反映する
+            execution_options={"synchronize_session": "evaluate"},
+        )
+        db_obj = result.one_or_none()
+        if db_obj is not None and "completed" not in values:
+            await self._update_counters(db, owner_id)
+        await db.commit()
+        return db_obj
 
+    async def remove_owned(self, db: AsyncSession, id: int, owner_id: int) -> Task | None:
+        """
+        Delete the task in one owner-scoped DELETE ... RETURNING.
+
+        Returns None if the task does not exist or belongs to someone else.
+        """
+        result = await db.scalars(
+            delete(Task).where(Task.id == id, Task.owner_id == owner_id).returning(Task),
+            execution_options={"synchronize_session": "evaluate"},
+        )
+        db_obj = result.one_or_none()
+        if db_obj is not None:
+            await self._record_removed(
+                db, owner_id, [(db_obj.completed, db_obj.created_at and db_obj.created_at.date())]
+            )
+        await db.commit()
+        return db_obj
+
+    async def get_owner_id(self, db: AsyncSession, id: int) -> int | None:
+        return await db.scalar(select(Task.owner_id).where(Task.id == id))
+
+    async def update_by_filter(
+        self, db: AsyncSession, owner_id: int, task_filter: TaskFilter, values: dict[str, Any]
+    ) -> int:
+        """Apply `values` to every matching task in one UPDATE; returns the row count."""
+        clauses = self._filter_clauses(owner_id, task_filter)
+        if "completed" in values:
+            await self._lock_rows(db, clauses)
+            await self._update_counters(
+                db,
+                owner_id,
+                completed=self._completed_delta(clauses, values["completed"]),
+                matching=clauses,
+            )
+        result = await db.execute(
+            update(Task)
+            .where(*clauses)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount and "completed" not in values:
+            await self._update_counters(db, owner_id)
+        await db.commit()
+        return result.rowcount
+
+    async def remove_by_filter(
+        self, db: AsyncSession, owner_id: int, task_filter: TaskFilter
+    ) -> int:
+        """Delete every matching task in one DELETE; returns the row count."""
+        result = await db.execute(
+            delete(Task)
+            .where(*self._filter_clauses(owner_id, task_filter))
+            .returning(Task.completed, func.date(Task.created_at, type_=Date))
+            .execution_options(synchronize_session=False)
+        )
+        removed = result.all()
+        if removed:
+            await self._record_removed(db, owner_id, removed)
+        await db.commit()
+        return len(removed)
+
+    async def get_version(self, db: AsyncSession, owner_id: int) -> int:
+        """The owner's task version; changes whenever any of their tasks is written."""
+        connection = await db.connection()
+        version = await connection.scalar(
+            select(task_counters.c.version).where(task_counters.c.owner_id == owner_id)
+        )
+        return version or 0
+
+    async def get_stats(
+        self, db: AsyncSession, owner_id: int, since: date
+    ) -> tuple[int, int, list[tuple[date, int]]]:
+        """
+        Read the owner's maintained counters: (total, completed, [(day, created)])
+        with days from `since` onwards. Touches only the counter tables.
+        """
+        connection = await db.connection()
+        counts = (
+            await connection.execute(
+                select(task_counters.c.total, task_counters.c.completed).where(
+                    task_counters.c.owner_id == owner_id
+                )
+            )
+        ).first()
+        days = await connection.execute(
+            select(task_daily_counts.c.day, task_daily_counts.c.created)
+            .where(
+                task_daily_counts.c.owner_id == owner_id,
+                task_daily_counts.c.day >= since,
+                task_daily_counts.c.created > 0,
+            )
+            .order_by(task_daily_counts.c.day)
+        )
+        total, completed = counts if counts else (0, 0)
+        return total, completed, [tuple(row) for row in days]
+
+    async def find_stats_drift(
+        self, db: AsyncSession, owner_id: int | None = None
+    ) -> list[tuple[int, str, int, int]]:
+        """
+        Compare the maintained counters with a full recount of the tasks table.
+
+        Returns (owner_id, counter, stored, actual) for every mismatch, where counter is
+        "total", "completed" or a creation day in ISO format.
+        """
+        connection = await db.connection()
+        actual = await self._recount(connection, owner_id)
+        stored: dict[tuple[int, str], int] = {}
+        counters = select(task_counters.c.owner_id, task_counters.c.total, task_counters.c.completed)
+        days = select(
+            task_daily_counts.c.owner_id, task_daily_counts.c.day, task_daily_counts.c.created
+        ).where(task_daily_counts.c.created != 0)
+        if owner_id is not None:
+            counters = counters.where(task_counters.c.owner_id == owner_id)
+            days = days.where(task_daily_counts.c.owner_id == owner_id)
+        for row_owner, total, completed in await connection.execute(counters):
+            stored[(row_owner, "total")] = total
+            stored[(row_owner, "completed")] = completed
+        for row_owner, day, created in await connection.execute(days):
+            stored[(row_owner, day.isoformat())] = created
+        return [
+            (key[0], key[1], stored.get(key, 0), actual.get(key, 0))
+            for key in sorted(stored.keys() | actual.keys())
+            if stored.get(key, 0) != actual.get(key, 0)
+        ]
+
+    async def rebuild_stats(self, db: AsyncSession, owner_id: int | None = None) -> None:
+        """Recompute total/completed and the per-day counts from the tasks table and commit."""
+        connection = await db.connection()
+        counts, days = self._recount_queries(owner_id)
+        counts = counts.subquery()
+        # カウンタ行がない所有者の分を作ってから、数え直した値で上書きする
+        await connection.execute(
+            insert(task_counters).from_select(
+                ["owner_id", "version", "total", "completed"],
+                select(counts.c.owner_id, 0, 0, 0).where(
+                    counts.c.owner_id.not_in(select(task_counters.c.owner_id))
+                ),
+            )
+        )
+        recounted = task_counters.c.owner_id == counts.c.owner_id
+        counters = update(task_counters).values(
+            total=func.coalesce(select(counts.c.total).where(recounted).scalar_subquery(), 0),
+            completed=func.coalesce(
+                select(counts.c.completed).where(recounted).scalar_subquery(), 0
+            ),
+        )
+        delete_days = delete(task_daily_counts)
+        if owner_id is not None:
+            counters = counters.where(task_counters.c.owner_id == owner_id)
+            delete_days = delete_days.where(task_daily_counts.c.owner_id == owner_id)
+        await connection.execute(counters)
+        await connection.execute(delete_days)
+        await connection.execute(
+            insert(task_daily_counts).from_select(["owner_id", "day", "created"], days)
+        )
+        await db.commit()
+
+    async def _recount(self, connection, owner_id: int | None) -> dict[tuple[int, str], int]:
+        counts, days = self._recount_queries(owner_id)
+        actual: dict[tuple[int, str], int] = {}
+        for row_owner, total, completed in await connection.execute(counts):
+            actual[(row_owner, "total")] = total
+            actual[(row_owner, "completed")] = completed
+        for row_owner, day, created in await connection.execute(days):
+            actual[(row_owner, day.isoformat())] = created
+        return actual
+
+    @staticmethod
+    def _recount_queries(owner_id: int | None) -> tuple[Select, Select]:
+        """(owner_id, total, completed) and (owner_id, day, created) straight from the tasks table."""
+        owned = [Task.owner_id.is_not(None)]
+        if owner_id is not None:
+            owned.append(Task.owner_id == owner_id)
+        counts = (
+            select(
+                Task.owner_id,
+                func.count().label("total"),
+                func.coalesce(func.sum(case((Task.completed.is_(True), 1), else_=0)), 0).label(
+                    "completed"
+                ),
+            )
+            .where(*owned)
+            .group_by(Task.owner_id)
+        )
+        created_day = func.date(Task.created_at, type_=Date)
+        days = (
+            select(Task.owner_id, created_day, func.count())
+            .where(*owned, Task.created_at.is_not(None))
+            .group_by(Task.owner_id, created_day)
+        )
+        return counts, days
+
+    async def _record_created(self, db: AsyncSession, owner_id: int, count: int) -> None:
+        await self._update_counters(db, owner_id, total=count)
+        # created_at の既定値（func.now()）と同じくDB側の日付で数える
+        connection = await db.connection()
+        upsert = _UPSERTS[connection.dialect.name](task_daily_counts).values(
+            owner_id=owner_id, day=func.current_date(), created=count
+        )
+        await connection.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[task_daily_counts.c.owner_id, task_daily_counts.c.day],
+                set_={"created": task_daily_counts.c.created + upsert.excluded.created},
+            )
+        )
+
+    async def _record_removed(
+        self, db: AsyncSession, owner_id: int, removed: Sequence[tuple[bool | None, date | None]]
+    ) -> None:
+        """`removed` holds (completed, creation day) of each deleted task."""
+        await self._update_counters(
+            db,
+            owner_id,
+            total=-len(removed),
+            completed=-sum(1 for completed, _ in removed if completed),
+        )
+        per_day = Counter(day for _, day in removed if day is not None)
+        if per_day:
+            connection = await db.connection()
+            await connection.execute(
+                update(task_daily_counts)
+                .where(
+                    task_daily_counts.c.owner_id == owner_id,
+                    task_daily_counts.c.day == bindparam("b_day"),
+                )
+                .values(created=task_daily_counts.c.created - bindparam("b_count")),
+                [{"b_day": day, "b_count": count} for day, count in per_day.items()],
+            )
+
+    @staticmethod
+    async def _update_counters(
+        db: AsyncSession,
+        owner_id: int,
+        total: int = 0,
+        completed: int | ColumnElement[int] = 0,
+        matching: list[ColumnElement[bool]] | None = None,
+    ) -> None:
+        # 書き込みと同じトランザクションで、バージョンの加算と件数の増減を1文で行う（行がなければ作成）。
+        # `matching` を渡した場合は、条件に一致するタスクがあるときだけ行う
+        connection = await db.connection()
+        upsert = _UPSERTS[connection.dialect.name](task_counters)
+        if matching is None:
+            upsert = upsert.values(owner_id=owner_id, version=1, total=total, completed=completed)
+        else:
+            upsert = upsert.from_select(
+                ["owner_id", "version", "total", "completed"],
+                select(
+                    literal(owner_id), literal(1), literal(total), completed
+                ).where(exists().where(*matching)),
+            )
+        await connection.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[task_counters.c.owner_id],
+                set_={
+                    "version": task_counters.c.version + 1,
+                    "total": task_counters.c.total + upsert.excluded.total,
+                    "completed": task_counters.c.completed + upsert.excluded.completed,
+                },
+            )
+        )
+
+    @staticmethod
+    async def _lock_rows(db: AsyncSession, clauses: list[ColumnElement[bool]]) -> None:
+        """
+        Lock the rows matching `clauses` until commit, so a concurrent write to the
+        same tasks waits and `_completed_delta` then reads its committed values.
+        """
+        connection = await db.connection()
+        # SQLite は書き込みをDB全体で直列化し、古いスナップショットのままでは書き込めないため不要
+        if connection.dialect.name == "sqlite":
+            return
+        locked = select(Task.id).where(*clauses).with_for_update().subquery()
+        await connection.execute(select(func.count()).select_from(locked))
+
+    @staticmethod
+    def _completed_delta(
+        clauses: list[ColumnElement[bool]], completed: bool | None
+    ) -> ColumnElement[int]:
+        """How the completed count changes if `completed` is set on the rows matching `clauses`."""
+        was_completed = func.coalesce(func.sum(case((Task.completed.is_(True), 1), else_=0)), 0)
+        delta = func.count() - was_completed if completed else -was_completed
+        return select(delta).where(*clauses).scalar_subquery()
+
+    @staticmethod
+    def _filter_clauses(owner_id: int, task_filter: TaskFilter) -> list[ColumnElement[bool]]:
+        # 所有者の条件は常に付与し、他人のタスクには触れない
+        clauses = [Task.owner_id == owner_id]
+        if task_filter.ids is not None:
+            clauses.append(Task.id.in_(task_filter.ids))
+        if task_filter.completed is not None:
+            clauses.append(Task.completed == task_filter.completed)
+        if task_filter.created_after is not None:
+            clauses.append(Task.created_at >= _created_at(task_filter.created_after))
+        if task_filter.created_before is not None:
+            clauses.append(Task.created_at < _created_at(task_filter.created_before))
+        if task_filter.title_prefix:
+            # LIKE は SQLite では大文字小文字を区別せず、% や _ のエスケープも要るため、範囲で比べて
+            # (owner_id, title, id) インデックスをシークする
+            prefix = task_filter.title_prefix
+            clauses.append(Task.title >= prefix)
+            upper_bound = _prefix_upper_bound(prefix)
+            if upper_bound is not None:
+                clauses.append(Task.title < upper_bound)
+            # 照合順序によっては範囲に前方一致しない行も入るため、範囲内の行を確かめ直す
+            clauses.append(func.substr(Task.title, 1, len(prefix)) == prefix)
+        return clauses
+
+
+task = CRUDTask(Task)
@@ -1,27 +1,54 @@
 # app/crud/user.py
 
-from sqlalchemy.orm import Session
+from typing import Any
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.cache import invalidate_principal
+from app.auth.revocation import revocation_list
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
-    def get_by_email(self, db: Session, email: str) -> User | None:
-        return db.query(User).filter(User.email == email).first()
+    async def get_by_email(self, db: AsyncSession, email: str) -> User | None:
+        return await db.scalar(select(User).where(User.email == email))
+
+    async def get_inactive_ids(self, db: AsyncSession, limit: int) -> list[int]:
+        result = await db.scalars(
+            select(User.id).where(User.is_active.is_(False)).order_by(User.id).limit(limit)
+        )
+        return list(result)
 
-    def create(self, db: Session, obj_in: UserCreate) -> User:
+    async def create(self, db: AsyncSession, obj_in: UserCreate) -> User:
         # パスワードハッシュはService層で行うため、ここでは未実装
         # obj_in.password は直接DBに保存せず、ハッシュ化されたものを使う
         db_obj = User(email=obj_in.email, hashed_password=obj_in.password) # 実際にはhashed_passwordをセットする
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
         return db_obj
 
+    async def update(
+        self, db: AsyncSession, db_obj: User, obj_in: UserUpdate | dict[str, Any]
+    ) -> User:
+        # 更新前のメールアドレスでキャッシュされている分も破棄する
+        invalidate_principal(db_obj)
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=obj_in)
+        invalidate_principal(db_obj)
+        if db_obj.is_active:
+            revocation_list.restore(db_obj.id)
+        else:
+            revocation_list.deactivate(db_obj.id)
+        return db_obj
 
-user = CRUDUser(User)
-
+    async def remove(self, db: AsyncSession, id: int) -> User | None:
+        db_obj = await super().remove(db, id=id)
+        if db_obj:
+            invalidate_principal(db_obj)
+            revocation_list.delete(db_obj.id)
+        return db_obj
 
 
+user = CRUDUser(User)
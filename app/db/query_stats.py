@@ -0,0 +1,122 @@
+# app/db/query_stats.py
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# ログに出すパラメータの最大文字数
+MAX_LOGGED_PARAMETERS = 500
+
+
+class QueryStats:
+    """
+    SQL statements executed while tracking was active, and the time spent in them.
+
+    Statements are also counted in the enclosing tracker, if any. With
+    `collect=True` each (statement, seconds) is kept in `statements`.
+    """
+
+    __slots__ = ("count", "seconds", "statements", "endpoint", "parent")
+
+    def __init__(
+        self,
+        collect: bool = False,
+        endpoint: str | None = None,
+        parent: "QueryStats | None" = None,
+    ) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: list[tuple[str, float]] | None = [] if collect else None
+        self.endpoint = endpoint or (parent.endpoint if parent else None)
+        self.parent = parent
+
+    def record(self, statement: str, seconds: float) -> None:
+        stats: QueryStats | None = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            if stats.statements is not None:
+                stats.statements.append((statement, seconds))
+            stats = stats.parent
+
+
+# リクエストごとの集計先。async エンジンのイベントも greenlet 経由で同じコンテキストで呼ばれる
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(collect: bool = False, endpoint: str | None = None) -> Iterator[QueryStats]:
+    """
+    Count the statements executed on any engine within the block (same context only).
+
+    `endpoint` names the request in slow-query log lines.
+    """
+    stats = QueryStats(collect=collect, endpoint=endpoint, parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _timing_enabled() -> bool:
+    return _current.get() is not None or settings.DB_SLOW_QUERY_MS > 0
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _timing_enabled():
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.get("query_started")
+    if started:
+        _finish(statement, parameters, time.perf_counter() - started.pop())
+
+
+def _handle_error(exception_context) -> None:
+    # 失敗した文では after_cursor_execute が呼ばれないため、ここで開始時刻を取り出す
+    conn = exception_context.connection
+    started = conn.info.get("query_started") if conn is not None else None
+    if started:
+        _finish(
+            exception_context.statement,
+            exception_context.parameters,
+            time.perf_counter() - started.pop(),
+        )
+
+
+def _finish(statement: str | None, parameters: Any, seconds: float) -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement or "", seconds)
+    if 0 < settings.DB_SLOW_QUERY_MS <= seconds * 1000:
+        endpoint = stats.endpoint if stats is not None and stats.endpoint else "-"
+        if not settings.DB_PROFILING:
+            # パラメータには個人情報や認証情報が含まれうるため、デバッグ時以外は出さない
+            logger.warning("Slow query (%.1f ms) in %s: %s", seconds * 1000, endpoint, statement)
+            return
+        logger.warning(
+            "Slow query (%.1f ms) in %s: %s parameters=%s",
+            seconds * 1000,
+            endpoint,
+            statement,
+            repr(parameters)[:MAX_LOGGED_PARAMETERS],
+        )
+
+
+def install_query_hooks(target=Engine) -> None:
+    """Listen on `target` (every engine by default) so track_queries() sees its statements."""
+    if not event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
+        event.listen(target, "handle_error", _handle_error)
@@ -0,0 +1,70 @@
+# app/db/routing.py
+
+import hashlib
+import itertools
+from typing import Literal, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import TTLCache
+from app.db.pool import PoolTelemetry
+
+ReplicaSelection = Literal["round_robin", "least_busy"]
+
+
+class DatabaseRouter:
+    """
+    Chooses the session factory for a request: writes always go to the primary,
+    reads to a replica unless the client wrote recently (read-your-writes).
+
+    Args:
+        primary: Session factory bound to the primary database
+        replicas: (session factory, pool telemetry) per read replica
+        selection: "round_robin", or "least_busy" for the replica with the fewest
+            connections in use
+        pin_seconds: How long reads stay on the primary after a write (0 disables)
+        pin_max_entries: Maximum number of clients pinned at once
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replicas: Sequence[tuple[async_sessionmaker[AsyncSession], PoolTelemetry]] = (),
+        selection: ReplicaSelection = "round_robin",
+        pin_seconds: float = 0.0,
+        pin_max_entries: int = 100000,
+    ):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.selection = selection
+        self._next = itertools.count()
+        # sha256(クライアントキー) -> True。期限が切れるまで読み取りをプライマリに向ける
+        self._pins: TTLCache[bytes, bool] | None = (
+            TTLCache(maxsize=pin_max_entries, ttl=pin_seconds) if pin_seconds > 0 else None
+        )
+
+    def writer(self) -> async_sessionmaker[AsyncSession]:
+        return self.primary
+
+    def reader(self, client_key: str | None = None) -> async_sessionmaker[AsyncSession]:
+        if not self.replicas or self.is_pinned(client_key):
+            return self.primary
+        start = next(self._next) % len(self.replicas)
+        if self.selection == "least_busy":
+            # 同数の場合は開始位置をずらして偏りを防ぐ
+            order = self.replicas[start:] + self.replicas[:start]
+            return min(order, key=lambda replica: replica[1].in_use)[0]
+        return self.replicas[start][0]
+
+    def mark_write(self, client_key: str | None) -> None:
+        if self._pins is not None and client_key:
+            self._pins.set(self._pin_key(client_key), True)
+
+    def is_pinned(self, client_key: str | None) -> bool:
+        if self._pins is None or not client_key:
+            return False
+        return self._pins.get(self._pin_key(client_key)) is not None
+
+    @staticmethod
+    def _pin_key(client_key: str) -> bytes:
+        return hashlib.sha256(client_key.encode()).digest()
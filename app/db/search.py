@@ -0,0 +1,88 @@
+# app/db/search.py
+
+import re
+
+from sqlalchemy import DDL, ColumnElement, Table, event, func, literal_column
+
+# SQLite: tasks を外部コンテンツとする FTS5 テーブルを、トリガーで同期する。
+# owner_id も索引して MATCH の中で絞り込み、他のユーザーの一致行を読まないようにする
+SQLITE_FTS_TABLE = "tasks_fts"
+SQLITE_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, owner_id,
+        content='tasks', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description, owner_id)
+        VALUES (new.id, new.title, new.description, new.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', old.id, old.title, old.description, old.owner_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description, owner_id
+    ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description, owner_id)
+        VALUES ('delete', old.id, old.title, old.description, old.owner_id);
+        INSERT INTO tasks_fts (rowid, title, description, owner_id)
+        VALUES (new.id, new.title, new.description, new.owner_id);
+    END
+    """,
+)
+
+# PostgreSQL: 式インデックス（GIN）。クエリ側の式と一字一句同じでないと使われない
+POSTGRES_SEARCH_VECTOR = (
+    "to_tsvector('simple'::regconfig, "
+    "coalesce(tasks.title, '') || ' ' || coalesce(tasks.description, ''))"
+)
+POSTGRES_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search ON tasks USING gin ("
+    "to_tsvector('simple'::regconfig, coalesce(title, '') || ' ' || coalesce(description, '')))",
+)
+
+# タイトルの一致を説明文より重く評価する（owner_id は絞り込み専用）
+SQLITE_RANK = "bm25(tasks_fts, 10.0, 5.0, 0.0)"
+
+
+def install_search_ddl(table: Table) -> None:
+    """Create the full-text index alongside `table` in create_all/drop_all."""
+    for statement in SQLITE_DDL:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        table, "before_drop", DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite")
+    )
+    for statement in POSTGRES_DDL:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+
+def is_search_object(name: str | None) -> bool:
+    """
+    The FTS5 tables (with their shadow tables) and the GIN index are not in the
+    metadata; autogenerate must skip them.
+    """
+    return bool(name) and (name.startswith(SQLITE_FTS_TABLE) or name == "ix_tasks_search")
+
+
+def search_terms(query: str) -> list[str]:
+    # 演算子や記号は解釈せず、語の AND として扱う
+    return re.findall(r"\w+", query)
+
+
+def sqlite_match(owner_id: int, terms: list[str]) -> str:
+    phrases = " ".join(f'"{term}"' for term in terms)
+    return f'owner_id : "{owner_id}" AND {{title description}} : ({phrases})'
+
+
+def postgres_search_vector() -> ColumnElement:
+    return literal_column(POSTGRES_SEARCH_VECTOR)
+
+
+def postgres_search_query(terms: list[str]) -> ColumnElement:
+    return func.plainto_tsquery(literal_column("'simple'::regconfig"), " ".join(terms))
@@ -1,26 +1,233 @@
 # app/db/session.py
 
-from typing import Generator
+from typing import Any, AsyncGenerator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import Depends, Request
+from sqlalchemy import Engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool, PoolTelemetry
+from app.db.routing import DatabaseRouter
 
-# SQLiteの場合、check_same_thread=Falseが必要
-engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# ドライバ未指定のURLは非同期ドライバ（aiosqlite / asyncpg）に読み替える
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+_SYNC_DRIVERS = {"sqlite": "sqlite", "postgresql": "postgresql"}
 
 
-def get_db() -> Generator:
+def get_async_url(url: str) -> str:
+    """Return `url` with an asyncio driver (aiosqlite locally, asyncpg in production)."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() in _ASYNC_DRIVERS and parsed.get_driver_name() not in (
+        "aiosqlite",
+        "asyncpg",
+    ):
+        parsed = parsed.set(drivername=_ASYNC_DRIVERS[parsed.get_backend_name()])
+    return parsed.render_as_string(hide_password=False)
+
+
+def get_sync_url(url: str) -> str:
+    """Return `url` with the default blocking driver, for maintenance scripts."""
+    parsed = make_url(url)
+    if parsed.get_driver_name() in ("aiosqlite", "asyncpg"):
+        parsed = parsed.set(drivername=_SYNC_DRIVERS[parsed.get_backend_name()])
+    return parsed.render_as_string(hide_password=False)
+
+
+def _connect_args(url: str) -> dict:
+    # SQLiteの場合、check_same_thread=Falseが必要
+    if make_url(url).get_backend_name() == "sqlite":
+        return {"check_same_thread": False}
+    return {}
+
+
+# PRAGMA の読み出し結果は数値で返るものがあるため、比較用に名前から変換する
+_PRAGMA_ENUMS = {
+    "synchronous": {"OFF": 0, "NORMAL": 1, "FULL": 2, "EXTRA": 3},
+    "temp_store": {"DEFAULT": 0, "FILE": 1, "MEMORY": 2},
+}
+
+
+def sqlite_pragmas(url: str) -> dict[str, Any]:
+    """PRAGMAs to run on every new connection, from the SQLITE_* settings (SQLite only)."""
+    if make_url(url).get_backend_name() != "sqlite" or not settings.SQLITE_TUNING:
+        return {}
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+
+
+def install_sqlite_pragmas(engine: Engine, pragmas: dict[str, Any]) -> None:
+    """Apply `pragmas` to each DBAPI connection as the pool opens it."""
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+async def verify_sqlite_pragmas(
+    engine: AsyncEngine, pragmas: dict[str, Any]
+) -> dict[str, tuple[Any, Any]]:
     """
-    Dependency for getting a database session.
+    Read `pragmas` back on a pooled connection; returns {name: (expected, actual)}
+    for every setting SQLite did not accept (e.g. WAL on a network filesystem).
     """
-    db = SessionLocal()
-    try:
+    mismatches = {}
+    if not pragmas:
+        return mismatches
+    async with engine.connect() as connection:
+        for name, value in pragmas.items():
+            actual = await connection.scalar(text(f"PRAGMA {name}"))
+            expected = _PRAGMA_ENUMS.get(name, {}).get(str(value).upper(), value)
+            if str(actual).lower() != str(expected).lower():
+                mismatches[name] = (expected, actual)
+    return mismatches
+
+
+SQLITE_PRAGMAS = sqlite_pragmas(settings.DATABASE_URL)
+
+
+def _async_engine_args(url: str) -> dict:
+    args = {"pool_recycle": settings.DB_POOL_RECYCLE, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    parsed = make_url(url)
+    # aiosqlite はファイルDBでも既定で NullPool（リクエスト毎に接続）になり、
+    # PRAGMA も毎回実行されてしまうため、チューニング時のみキュー型プールにする
+    if parsed.get_backend_name() == "sqlite" and not (
+        SQLITE_PRAGMAS and parsed.database not in (None, "", ":memory:")
+    ):
+        return args
+    return {
+        **args,
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+
+# Async engine used by the API
+async_engine = create_async_engine(
+    get_async_url(settings.DATABASE_URL),
+    connect_args=_connect_args(settings.DATABASE_URL),
+    **_async_engine_args(settings.DATABASE_URL),
+)
+install_sqlite_pragmas(async_engine.sync_engine, SQLITE_PRAGMAS)
+pool_telemetry = PoolTelemetry()
+pool_telemetry.attach(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def _create_replica(url: str) -> tuple[async_sessionmaker[AsyncSession], PoolTelemetry]:
+    replica_engine = create_async_engine(
+        get_async_url(url), connect_args=_connect_args(url), **_async_engine_args(url)
+    )
+    install_sqlite_pragmas(replica_engine.sync_engine, sqlite_pragmas(url))
+    telemetry = PoolTelemetry()
+    telemetry.attach(replica_engine.sync_engine)
+    session_factory = async_sessionmaker(
+        bind=replica_engine, autoflush=False, expire_on_commit=False
+    )
+    return session_factory, telemetry
+
+
+# 読み取りはレプリカ、書き込みはプライマリへ振り分ける
+db_router = DatabaseRouter(
+    AsyncSessionLocal,
+    replicas=[_create_replica(url) for url in settings.REPLICA_DATABASE_URLS],
+    selection=settings.REPLICA_SELECTION,
+    pin_seconds=settings.READ_YOUR_WRITES_SECONDS,
+    pin_max_entries=settings.READ_YOUR_WRITES_MAX_ENTRIES,
+)
+
+
+def get_pool_stats() -> dict:
+    """Connection pool telemetry of the API engine (see app.db.pool.PoolTelemetry)."""
+    return pool_telemetry.stats(async_engine.sync_engine.pool)
+
+
+def get_all_pool_stats() -> dict[str, dict]:
+    """Pool telemetry of the primary and of each read replica ("replica0", "replica1", ...)."""
+    stats = {"primary": get_pool_stats()}
+    for i, (session_factory, telemetry) in enumerate(db_router.replicas):
+        stats[f"replica{i}"] = telemetry.stats(session_factory.kw["bind"].sync_engine.pool)
+    return stats
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency for code that must manage its own session, e.g. streaming responses
+    that outlive the request-scoped `get_db` session.
+    """
+    return AsyncSessionLocal
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting an async database session.
+    """
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
+def get_db_router() -> DatabaseRouter:
+    return db_router
+
+
+def _client_key(request: Request) -> str | None:
+    # 同じトークンを使うクライアントには自分の書き込みが見えるようにする
+    return request.headers.get("Authorization")
 
+
+async def get_read_db(
+    request: Request, router: DatabaseRouter = Depends(get_db_router)
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only endpoints: a replica session, or the primary if there
+    are no replicas or this client wrote within READ_YOUR_WRITES_SECONDS.
+    """
+    async with router.reader(_client_key(request))() as db:
+        yield db
+
+
+def get_read_session_factory(
+    request: Request, router: DatabaseRouter = Depends(get_db_router)
+) -> async_sessionmaker[AsyncSession]:
+    """Like `get_read_db`, for streaming responses that open their own session."""
+    return router.reader(_client_key(request))
+
+
+async def get_write_db(
+    request: Request, router: DatabaseRouter = Depends(get_db_router)
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for endpoints that write: a primary session. Pins the client's
+    subsequent reads to the primary for READ_YOUR_WRITES_SECONDS after the
+    write finishes.
+    """
+    client_key = _client_key(request)
+    # 応答後に実行されると次の読み取りと競合しうるため、書き込み前にピン留めし、
+    # 長い書き込み（大きなインポート等）で期限が切れないよう終了後にも延長する
+    router.mark_write(client_key)
+    try:
+        async with router.writer()() as db:
+            yield db
+    finally:
+        router.mark_write(client_key)
@@ -1,18 +1,60 @@
 # app/main.py
 
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
 
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from app.api import metrics
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.hashing import PasswordHashPoolBusy, password_hasher
+from app.core.metrics import MetricsMiddleware, request_metrics
+from app.core.profiling import QueryProfilerMiddleware
+from app.db.query_stats import install_query_hooks
+from app.db.session import SQLITE_PRAGMAS, async_engine, verify_sqlite_pragmas
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 設定したPRAGMAが実際に効いているか起動時に確認する（WAL非対応のファイルシステム等）
+    mismatches = await verify_sqlite_pragmas(async_engine, SQLITE_PRAGMAS)
+    for name, (expected, actual) in mismatches.items():
+        logger.warning("SQLite PRAGMA %s is %r, expected %r", name, actual, expected)
+    yield
+    password_hasher.shutdown()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="JWT認証付きタスク管理API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# すべてのエンジンのSQLを計測する（スロークエリログ・メトリクス・プロファイリング）
+install_query_hooks()
+# DB_PROFILING は実行時に参照するため、常に組み込んでおく（無効時は素通し）
+app.add_middleware(QueryProfilerMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, metrics=request_metrics)
+    app.include_router(metrics.router)
+
+
+@app.exception_handler(PasswordHashPoolBusy)
+async def password_hash_pool_busy_handler(request: Request, exc: PasswordHashPoolBusy):
+    # ログイン集中時は待たせ続けず、すぐに再試行を促す
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
 
 @app.get("/", tags=["Root"])
 async def read_root():
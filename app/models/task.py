@@ -1,21 +1,39 @@
 # app/models/task.py
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func # funcをインポート
 
 from app.db.base import Base
+from app.db.search import install_search_ddl
 
 
 class Task(Base):
     __tablename__ = "tasks"
+    # タスクへのアクセスは常に owner_id で絞り込むため、owner_id を先頭にした複合インデックスを張る。
+    # 一覧の並び順（id / created_at, id）ごとに、completed での絞り込みあり・なしの両方を用意する
+    __table_args__ = (
+        Index("ix_tasks_owner_id_id", "owner_id", "id"),
+        Index("ix_tasks_owner_id_created_at_id", "owner_id", "created_at", "id"),
+        Index("ix_tasks_owner_id_completed_id", "owner_id", "completed", "id"),
+        Index(
+            "ix_tasks_owner_id_completed_created_at_id", "owner_id", "completed", "created_at", "id"
+        ),
+        # タイトルの前方一致（範囲での比較）用
+        Index("ix_tasks_owner_id_title_id", "owner_id", "title", "id"),
+    )
+    # INSERT/UPDATE時に id や created_at を RETURNING で受け取り、コミット後の再SELECTを不要にする
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True, nullable=False)
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
     description = Column(String, nullable=True)
     completed = Column(Boolean, default=False)
     owner_id = Column(Integer, ForeignKey("users.id"))
-    created_at = Column(DateTime, default=func.now()) # created_atを追加
+    created_at = Column(DateTime, nullable=False, default=func.now()) # created_atを追加
 
     owner = relationship("User", back_populates="tasks")
 
+
+# タイトル・説明文の全文検索インデックス（SQLite: FTS5 / PostgreSQL: GIN）
+install_search_ddl(Task.__table__)
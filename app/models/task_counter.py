@@ -0,0 +1,27 @@
+# app/models/task_counter.py
+
+from sqlalchemy import BigInteger, Column, Date, ForeignKey, Integer
+
+from app.db.base import Base
+
+
+class TaskCounter(Base):
+    """Per-user counters kept up to date by the task write paths in CRUDTask."""
+
+    __tablename__ = "task_counters"
+
+    owner_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    # タスクが変更されるたびに1ずつ増える。ETagに使う
+    version = Column(BigInteger, nullable=False, default=0)
+    total = Column(Integer, nullable=False, default=0)
+    completed = Column(Integer, nullable=False, default=0)
+
+
+class TaskDailyCount(Base):
+    """Number of the user's existing tasks created on each day."""
+
+    __tablename__ = "task_daily_counts"
+
+    owner_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    created = Column(Integer, nullable=False, default=0)
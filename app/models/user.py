@@ -9,11 +9,13 @@ from app.db.base import Base
 
 class User(Base):
     __tablename__ = "users"
+    # INSERT/UPDATE時に id や created_at を RETURNING で受け取り、コミット後の再SELECTを不要にする
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime, default=func.now()) # created_atを追加
 
     tasks = relationship("Task", back_populates="owner")
@@ -1,6 +1,10 @@
 # app/schemas/task.py
 
-from pydantic import BaseModel
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, field_validator
 
 
 class TaskBase(BaseModel):
@@ -28,4 +32,73 @@ class Task(TaskInDBBase):
     pass
 
 
+class TaskFilter(BaseModel):
+    ids: list[int] | None = None
+    completed: bool | None = None
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    title_prefix: str | None = None
+
+    def is_empty(self) -> bool:
+        return not self.model_dump(exclude_none=True)
+
+
+class TaskBulkUpdate(BaseModel):
+    title: str | None = None
+    description: str | None = None
+    completed: bool | None = None
+
+    @field_validator("title", "completed")
+    @classmethod
+    def not_null(cls, value: Any) -> Any:
+        # 省略は可だが、明示的な null は許可しない
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
+
+class TaskBulkResult(BaseModel):
+    count: int
+
+
+class TaskDayCount(BaseModel):
+    day: date
+    count: int
+
+
+class TaskStats(BaseModel):
+    total: int
+    completed: int
+    open: int
+    created_per_day: list[TaskDayCount]
+
+
+class TaskImportError(BaseModel):
+    line: int
+    error: str
+
+
+class TaskImportResult(BaseModel):
+    imported: int = 0
+    failed: int = 0
+    errors: list[TaskImportError] = []
+
+
+class TaskExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+class TaskSort(str, Enum):
+    id = "id"
+    id_desc = "-id"
+    created_at = "created_at"
+    created_at_desc = "-created_at"
+
+    @property
+    def key(self) -> str:
+        return self.value.removeprefix("-")
 
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
@@ -12,4 +12,12 @@ class TokenData(BaseModel):
     email: str | None = None
 
 
+class StatelessTokenData(BaseModel):
+    """Claims carried by tokens issued in AUTH_STATELESS mode (`sub` is the user id)."""
+
+    sub: int
+    email: str
+    act: bool
+
+
 
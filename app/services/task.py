@@ -1,32 +1,166 @@
 # app/services/task.py
 
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Sequence
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.crud.task import TaskRow
 from app.crud.task import task as crud_task
 from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.task import (
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskDayCount,
+    TaskFilter,
+    TaskSort,
+    TaskStats,
+    TaskUpdate,
+)
 
 
-def create_task(db: Session, task_in: TaskCreate, owner_id: int) -> Task:
-    return crud_task.create_with_owner(db, obj_in=task_in, owner_id=owner_id)
+async def create_task(db: AsyncSession, task_in: TaskCreate, owner_id: int) -> Task:
+    return await crud_task.create_with_owner(db, obj_in=task_in, owner_id=owner_id)
 
 
-def get_task(db: Session, task_id: int) -> Task | None:
-    return crud_task.get(db, id=task_id)
+async def create_tasks(
+    db: AsyncSession, tasks_in: list[TaskCreate], owner_id: int
+) -> list[Task]:
+    return await crud_task.create_many_with_owner(db, objs_in=tasks_in, owner_id=owner_id)
 
 
-def get_user_tasks(
-    db: Session, owner_id: int, skip: int = 0, limit: int = 100
-) -> list[Task]:
-    return crud_task.get_tasks_by_owner(db, owner_id=owner_id, skip=skip, limit=limit)
+async def get_task(db: AsyncSession, task_id: int) -> Task | None:
+    return await crud_task.get(db, id=task_id)
+
+
+async def get_user_tasks(
+    db: AsyncSession,
+    owner_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    task_filter: TaskFilter | None = None,
+    sort: TaskSort = TaskSort.id,
+) -> Sequence[TaskRow]:
+    return await crud_task.get_rows_by_owner(
+        db, owner_id=owner_id, skip=skip, limit=limit, task_filter=task_filter, sort=sort
+    )
+
+
+async def search_user_tasks(
+    db: AsyncSession, owner_id: int, query: str, skip: int = 0, limit: int = 20
+) -> Sequence[TaskRow]:
+    return await crud_task.search_rows_by_owner(
+        db, owner_id=owner_id, query=query, skip=skip, limit=limit
+    )
+
+
+async def get_user_tasks_page(
+    db: AsyncSession,
+    owner_id: int,
+    cursor: str | None = None,
+    limit: int = 100,
+    task_filter: TaskFilter | None = None,
+    sort: TaskSort = TaskSort.id,
+) -> tuple[Sequence[TaskRow], str | None]:
+    """
+    Return one keyset page of the owner's tasks and the cursor for the next page.
+
+    Raises ValueError if `cursor` is malformed or was issued for another sort.
+    """
+    after_id = after_created_at = None
+    if cursor:
+        position = decode_cursor(cursor)
+        after_id = position.get("id")
+        # bool は int のサブクラスなので型そのもので確認する
+        if type(after_id) is not int or position.get("sort", TaskSort.id.value) != sort.value:
+            raise ValueError("Invalid cursor")
+        if sort.key == "created_at":
+            created_at = position.get("created_at")
+            if not isinstance(created_at, str):
+                raise ValueError("Invalid cursor")
+            after_created_at = datetime.fromisoformat(created_at)
+    tasks = await crud_task.get_rows_by_owner_after(
+        db,
+        owner_id=owner_id,
+        after_id=after_id,
+        limit=limit,
+        task_filter=task_filter,
+        sort=sort,
+        after_created_at=after_created_at,
+    )
+    return tasks, next_page_cursor(tasks, limit, sort)
+
+
+async def stream_user_tasks(
+    session_factory: async_sessionmaker[AsyncSession], owner_id: int, batch_size: int
+) -> AsyncIterator[Sequence[TaskRow]]:
+    """
+    Yield every task of the owner in batches.
+
+    Opens its own session so it can outlive the request-scoped one while a
+    streaming response is being sent.
+    """
+    async with session_factory() as db:
+        async for batch in crud_task.stream_rows_by_owner(
+            db, owner_id=owner_id, batch_size=batch_size
+        ):
+            yield batch
+
+
+async def get_tasks_version(db: AsyncSession, owner_id: int) -> int:
+    return await crud_task.get_version(db, owner_id=owner_id)
+
+
+async def get_task_stats(db: AsyncSession, owner_id: int, days: int) -> TaskStats:
+    """Counts from the maintained counters, with creation buckets for the last `days` days."""
+    # created_at はDBの現在時刻（SQLiteではUTC）で入るため、日付の区切りもUTCに合わせる
+    since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+    total, completed, per_day = await crud_task.get_stats(db, owner_id=owner_id, since=since)
+    return TaskStats(
+        total=total,
+        completed=completed,
+        open=total - completed,
+        created_per_day=[TaskDayCount(day=day, count=count) for day, count in per_day],
+    )
+
+
+def next_page_cursor(
+    tasks: Sequence[TaskRow], limit: int, sort: TaskSort = TaskSort.id
+) -> str | None:
+    # 件数がlimit未満なら最終ページ
+    if not tasks or len(tasks) < limit:
+        return None
+    # 既定の並び順では従来どおり {"id": ...} だけを入れる
+    if sort is TaskSort.id:
+        return encode_cursor({"id": tasks[-1].id})
+    position = {"sort": sort.value, "id": tasks[-1].id}
+    if sort.key == "created_at":
+        position["created_at"] = tasks[-1].created_at.isoformat()
+    return encode_cursor(position)
+
+
+async def update_task(
+    db: AsyncSession, task_id: int, owner_id: int, task_in: TaskUpdate
+) -> Task | None:
+    return await crud_task.update_owned(db, id=task_id, owner_id=owner_id, obj_in=task_in)
+
 
+async def delete_task(db: AsyncSession, task_id: int, owner_id: int) -> Task | None:
+    return await crud_task.remove_owned(db, id=task_id, owner_id=owner_id)
 
-def update_task(db: Session, db_task: Task, task_in: TaskUpdate) -> Task:
-    return crud_task.update(db, db_obj=db_task, obj_in=task_in)
 
+async def task_exists(db: AsyncSession, task_id: int) -> bool:
+    return await crud_task.get_owner_id(db, id=task_id) is not None
 
-def delete_task(db: Session, task_id: int) -> Task | None:
-    return crud_task.remove(db, id=task_id)
 
+async def update_tasks(
+    db: AsyncSession, owner_id: int, task_filter: TaskFilter, task_in: TaskBulkUpdate
+) -> int:
+    return await crud_task.update_by_filter(
+        db, owner_id=owner_id, task_filter=task_filter, values=task_in.model_dump(exclude_unset=True)
+    )
 
 
+async def delete_tasks(db: AsyncSession, owner_id: int, task_filter: TaskFilter) -> int:
+    return await crud_task.remove_by_filter(db, owner_id=owner_id, task_filter=task_filter)
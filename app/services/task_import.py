@@ -0,0 +1,159 @@
+# app/services/task_import.py
+
+import csv
+import json
+from typing import Any, AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.task import task as crud_task
+from app.schemas.task import TaskCreate, TaskExportFormat, TaskImportError, TaskImportResult
+
+
+class RecordError(Exception):
+    """A line that could not be turned into a record; reported instead of imported."""
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[tuple[int, bytes | RecordError]]:
+    """
+    Split a byte stream into numbered lines without holding more than one line in memory.
+
+    Lines longer than `max_line_bytes` are skipped and yielded as a RecordError.
+    """
+    buffer = bytearray()
+    line_no = 0
+    oversized = False
+    too_long = f"Line exceeds {max_line_bytes} bytes"
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            line_no += 1
+            if oversized or len(buffer) + end - start > max_line_bytes:
+                yield line_no, RecordError(too_long)
+            else:
+                buffer += chunk[start:end]
+                yield line_no, bytes(buffer)
+            buffer.clear()
+            oversized = False
+            start = end + 1
+        if not oversized:
+            buffer += chunk[start:]
+            if len(buffer) > max_line_bytes:
+                # 改行が来るまで読み捨てる
+                oversized = True
+                buffer.clear()
+    if buffer or oversized:
+        line_no += 1
+        yield line_no, RecordError(too_long) if oversized else bytes(buffer)
+
+
+async def _ndjson_records(
+    lines: AsyncIterator[tuple[int, bytes | RecordError]]
+) -> AsyncIterator[tuple[int, Any]]:
+    async for line_no, raw in lines:
+        if isinstance(raw, RecordError):
+            yield line_no, raw
+            continue
+        if not raw.strip():
+            continue
+        try:
+            yield line_no, json.loads(raw)
+        except json.JSONDecodeError as exc:
+            yield line_no, RecordError(f"Invalid JSON: {exc.msg}")
+        except UnicodeDecodeError:
+            yield line_no, RecordError("Line is not valid UTF-8")
+
+
+async def _csv_records(
+    lines: AsyncIterator[tuple[int, bytes | RecordError]], max_record_bytes: int
+) -> AsyncIterator[tuple[int, Any]]:
+    # 引用符内の改行（エクスポートした description など）は次の行と連結して1レコードにする
+    header: list[str] | None = None
+    pending: bytes = b""
+    start_no = 0
+    async for line_no, raw in lines:
+        if isinstance(raw, RecordError):
+            pending = b""
+            yield line_no, raw
+            continue
+        if not pending:
+            start_no = line_no
+        record = pending + b"\n" + raw if pending else raw
+        if record.count(b'"') % 2:
+            if len(record) > max_record_bytes:
+                pending = b""
+                yield start_no, RecordError(f"Record exceeds {max_record_bytes} bytes")
+            else:
+                pending = record
+            continue
+        pending = b""
+        try:
+            text = record.decode("utf-8").removeprefix("\ufeff").rstrip("\r")
+        except UnicodeDecodeError:
+            yield start_no, RecordError("Line is not valid UTF-8")
+            continue
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = values
+            continue
+        row = dict(zip(header, values))
+        # エクスポートでは null を空欄で出力しているため、空欄は null として扱う
+        if row.get("description") == "":
+            row["description"] = None
+        yield start_no, row
+    if pending:
+        yield start_no, RecordError("Unterminated quoted field")
+
+
+async def import_tasks(
+    db: AsyncSession, owner_id: int, chunks: AsyncIterator[bytes], fmt: TaskExportFormat
+) -> TaskImportResult:
+    """
+    Validate each record against TaskCreate and insert valid ones in batches of
+    TASK_IMPORT_BATCH_SIZE, each batch committed in its own transaction.
+
+    Memory is bounded by one line plus one batch; only the first
+    TASK_IMPORT_MAX_ERRORS line errors are kept, `failed` counts all of them.
+    """
+    result = TaskImportResult()
+    batch: list[TaskCreate] = []
+    lines = iter_lines(chunks, settings.TASK_IMPORT_MAX_LINE_BYTES)
+    if fmt is TaskExportFormat.csv:
+        records = _csv_records(lines, settings.TASK_IMPORT_MAX_LINE_BYTES)
+    else:
+        records = _ndjson_records(lines)
+
+    async for line_no, record in records:
+        try:
+            if isinstance(record, RecordError):
+                raise record
+            batch.append(TaskCreate.model_validate(record))
+        except (RecordError, ValidationError) as exc:
+            result.failed += 1
+            if len(result.errors) < settings.TASK_IMPORT_MAX_ERRORS:
+                result.errors.append(TaskImportError(line=line_no, error=_error_message(exc)))
+            continue
+        if len(batch) >= settings.TASK_IMPORT_BATCH_SIZE:
+            result.imported += await crud_task.insert_many_with_owner(
+                db, objs_in=batch, owner_id=owner_id
+            )
+            batch = []
+    result.imported += await crud_task.insert_many_with_owner(
+        db, objs_in=batch, owner_id=owner_id
+    )
+    return result
+
+
+def _error_message(exc: Exception) -> str:
+    if isinstance(exc, ValidationError):
+        return "; ".join(
+            f"{'.'.join(map(str, err['loc'])) or 'record'}: {err['msg']}"
+            for err in exc.errors()
+        )
+    return str(exc)
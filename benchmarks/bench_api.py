@@ -0,0 +1,318 @@
+# benchmarks/bench_api.py
+"""
+Benchmark the main API endpoints through the ASGI app on a seeded dataset.
+
+Measures throughput and p50/p95/p99 latency for login, task list (first page,
+deep page by offset and by cursor), detail, create, update and delete, and
+writes them as JSON. `compare` flags metrics that regressed against a baseline
+result beyond a tolerance and exits with status 1.
+
+Create, update and delete only touch the tasks the run itself creates, so a
+seeded database (see benchmarks.dataset) can be reused across runs.
+
+Usage:
+    python -m benchmarks.bench_api run --db /tmp/bench.db --output baseline.json
+    python -m benchmarks.bench_api run --db /tmp/bench.db --output current.json \\
+        --baseline baseline.json
+    python -m benchmarks.bench_api compare baseline.json current.json --tolerance 0.15
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.pagination import encode_cursor  # noqa: E402
+from benchmarks.dataset import PASSWORD, ensure_dataset, owner_weights, user_email  # noqa: E402
+
+PAGE_SIZE = 100
+# 値が大きいほど悪い指標は +1、小さいほど悪い指標は -1
+COMPARED_METRICS = {"p50_ms": 1, "p95_ms": 1, "p99_ms": 1, "throughput_rps": -1}
+
+READ_SCENARIOS = {"list_shallow", "list_deep_offset", "list_deep_cursor", "detail"}
+
+Call = Callable[[], Awaitable[httpx.Response]]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "max_ms": round(max(latencies) * 1000, 3),
+    }
+
+
+async def measure(calls: list[Call], concurrency: int) -> dict:
+    """Run `calls` on `concurrency` workers; responses with status >= 400 count as errors."""
+    latencies: list[float] = []
+    errors = 0
+    pending = iter(calls)
+
+    async def worker() -> None:
+        nonlocal errors
+        for call in pending:
+            started = time.perf_counter()
+            response = await call()
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+def heavy_user_position(path: str, owner_id: int, fraction: float) -> tuple[int, int]:
+    """Offset `fraction` of the way into the owner's tasks (by id) and the id just before it."""
+    with sqlite3.connect(path) as connection:
+        (count,) = connection.execute(
+            "SELECT count(*) FROM tasks WHERE owner_id = ?", (owner_id,)
+        ).fetchone()
+        offset = max(1, min(int(count * fraction), count - PAGE_SIZE))
+        (previous_id,) = connection.execute(
+            "SELECT id FROM tasks WHERE owner_id = ? ORDER BY id LIMIT 1 OFFSET ?",
+            (owner_id, offset - 1),
+        ).fetchone()
+    return offset, previous_id
+
+
+async def run_scenarios(client: httpx.AsyncClient, args: argparse.Namespace) -> dict:
+    api = settings.API_V1_STR
+    rng = random.Random(args.seed)
+    # よく使うユーザーほど選ばれやすいよう、データセットと同じ偏りで抽出する
+    sampled = sorted(
+        set(
+            rng.choices(
+                range(1, args.users + 1),
+                cum_weights=owner_weights(args.users, args.skew),
+                k=args.sample_users,
+            )
+        )
+    )
+
+    def login(user_id: int) -> Call:
+        return lambda: client.post(
+            f"{api}/login/access-token",
+            data={"username": user_email(user_id), "password": PASSWORD},
+        )
+
+    headers = {}
+    for user_id in sampled:
+        r = await login(user_id)()
+        headers[user_id] = {"Authorization": f"Bearer {r.json()['access_token']}"}
+    task_ids = []
+    for user_id in sampled:
+        r = await client.get(f"{api}/tasks/", params={"limit": PAGE_SIZE}, headers=headers[user_id])
+        task_ids += [(user_id, task["id"]) for task in r.json()]
+
+    deep_offset, deep_after_id = heavy_user_position(args.db, sampled[0], args.deep_fraction)
+    deep_cursor = encode_cursor({"id": deep_after_id})
+
+    def get(url: str, user_id: int, **params) -> Call:
+        return lambda: client.get(url, params=params, headers=headers[user_id])
+
+    created: list[tuple[int, int]] = []
+
+    def create(user_id: int, i: int) -> Call:
+        async def call() -> httpx.Response:
+            r = await client.post(
+                f"{api}/tasks/", json={"title": f"Benchmark task {i}"}, headers=headers[user_id]
+            )
+            if r.status_code == 201:
+                created.append((user_id, r.json()["id"]))
+            return r
+
+        return call
+
+    def update(user_id: int, task_id: int, i: int) -> Call:
+        return lambda: client.put(
+            f"{api}/tasks/{task_id}",
+            json={"title": f"Benchmark task {i} (updated)", "completed": i % 2 == 0},
+            headers=headers[user_id],
+        )
+
+    def delete(user_id: int, task_id: int) -> Call:
+        return lambda: client.delete(f"{api}/tasks/{task_id}", headers=headers[user_id])
+
+    n = args.requests
+    scenarios: dict[str, Callable[[], list[Call]]] = {
+        "login": lambda: [login(rng.choice(sampled)) for _ in range(args.login_requests)],
+        "list_shallow": lambda: [
+            get(f"{api}/tasks/", rng.choice(sampled), limit=PAGE_SIZE) for _ in range(n)
+        ],
+        "list_deep_offset": lambda: [
+            get(f"{api}/tasks/", sampled[0], skip=deep_offset, limit=PAGE_SIZE) for _ in range(n)
+        ],
+        "list_deep_cursor": lambda: [
+            get(f"{api}/tasks/", sampled[0], cursor=deep_cursor, limit=PAGE_SIZE)
+            for _ in range(n)
+        ],
+        "detail": lambda: [
+            get(f"{api}/tasks/{task_id}", user_id)
+            for user_id, task_id in rng.choices(task_ids, k=n)
+        ],
+        "create": lambda: [create(rng.choice(sampled), i) for i in range(n)],
+        "update": lambda: [
+            update(user_id, task_id, i)
+            for i, (user_id, task_id) in enumerate(rng.choices(created, k=n))
+        ],
+        "delete": lambda: [delete(user_id, task_id) for user_id, task_id in created],
+    }
+
+    results = {}
+    for name, build in scenarios.items():
+        calls = build()
+        if name in READ_SCENARIOS and args.warmup:
+            # キャッシュ（ページキャッシュ・ステートメントキャッシュ）を温める分は計測しない
+            await measure(calls[: args.warmup], args.concurrency)
+        results[name] = await measure(calls, args.concurrency)
+        print(
+            f"{name:<18} {results[name]['throughput_rps']:>9.1f} req/s  "
+            f"p50 {results[name]['p50_ms']:>8.2f} ms  p95 {results[name]['p95_ms']:>8.2f} ms  "
+            f"p99 {results[name]['p99_ms']:>8.2f} ms  errors {results[name]['errors']}"
+        )
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace, dataset: dict) -> dict:
+    # セッション（エンジン）はインポート時に作られるため、先に接続先を差し替える
+    settings.DATABASE_URL = f"sqlite+aiosqlite:///{os.path.abspath(args.db)}"
+    # 書き込みの競合で出るスロークエリログが計測結果の表示に混ざらないようにする
+    settings.DB_SLOW_QUERY_MS = 0
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            scenarios = await run_scenarios(client, args)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "dataset": dataset,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "login_requests": args.login_requests,
+            "warmup": args.warmup,
+            "sample_users": args.sample_users,
+            "deep_fraction": args.deep_fraction,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> list[str]:
+    """Print a metric-by-metric comparison; returns the regressed `scenario.metric` names."""
+    if baseline["meta"].get("dataset") != current["meta"].get("dataset"):
+        print("warning: results were measured on different datasets")
+    regressions = []
+    print(f"{'scenario':<18} {'metric':<15} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, base in baseline["scenarios"].items():
+        if name not in current["scenarios"]:
+            print(f"{name:<18} missing from current results")
+            continue
+        for metric, worse in COMPARED_METRICS.items():
+            before, after = base[metric], current["scenarios"][name][metric]
+            change = (after - before) / before if before else 0.0
+            regressed = change * worse > tolerance
+            if regressed:
+                regressions.append(f"{name}.{metric}")
+            print(
+                f"{name:<18} {metric:<15} {before:>10.2f} {after:>10.2f} {change:>+8.1%}"
+                + ("  REGRESSION" if regressed else "")
+            )
+    return regressions
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def check(baseline: dict, current: dict, tolerance: float) -> int:
+    regressions = compare(baseline, current, tolerance)
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"no regressions beyond {tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="seed (or reuse) the dataset and measure")
+    run_parser.add_argument(
+        "--db", default=os.path.join(tempfile.gettempdir(), "task_api_bench.db")
+    )
+    run_parser.add_argument("--users", type=int, default=10000)
+    run_parser.add_argument("--tasks", type=int, default=1000000)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--skew", type=float, default=1.1)
+    run_parser.add_argument("--requests", type=int, default=1000, help="per scenario")
+    run_parser.add_argument("--login-requests", type=int, default=200)
+    run_parser.add_argument("--concurrency", type=int, default=8)
+    run_parser.add_argument(
+        "--warmup", type=int, default=50, help="unmeasured requests before each read scenario"
+    )
+    run_parser.add_argument("--sample-users", type=int, default=100)
+    run_parser.add_argument(
+        "--deep-fraction", type=float, default=0.9,
+        help="how far into the heaviest user's tasks the deep pages start",
+    )
+    run_parser.add_argument("--output", help="write the results here as JSON")
+    run_parser.add_argument("--baseline", help="compare against this result file")
+    run_parser.add_argument("--tolerance", type=float, default=0.15)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--tolerance", type=float, default=0.15)
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        sys.exit(check(load(args.baseline), load(args.current), args.tolerance))
+
+    # 投入処理は自前のイベントループを使うため、計測のループを始める前に済ませる
+    dataset = ensure_dataset(args.db, args.users, args.tasks, args.seed, args.skew)
+    results = asyncio.run(run(args, dataset))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        sys.exit(check(load(args.baseline), results, args.tolerance))
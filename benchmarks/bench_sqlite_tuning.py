@@ -0,0 +1,95 @@
+# benchmarks/bench_sqlite_tuning.py
+"""
+Compare task write throughput on SQLite with its defaults (rollback journal,
+synchronous=FULL) and with the SQLITE_* tuning profile from Settings.
+
+Usage:
+    python -m benchmarks.bench_sqlite_tuning --writes 2000 --writers 8
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import AsyncAdaptedQueuePool  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.crud.task import task as crud_task  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import install_sqlite_pragmas, sqlite_pragmas  # noqa: E402
+from app.models.task import Task  # noqa: F401,E402
+from app.models.user import User  # noqa: E402
+from app.schemas.task import TaskCreate  # noqa: E402
+
+
+def seed(path: str) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(
+            User.__table__.insert(), [{"email": "bench@example.com", "hashed_password": "x"}]
+        )
+    engine.dispose()
+
+
+async def measure(path: str, pragmas: dict, writes: int, writers: int) -> dict[str, float]:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", poolclass=AsyncAdaptedQueuePool, pool_size=writers
+    )
+    install_sqlite_pragmas(engine.sync_engine, pragmas)
+    session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def writer(count: int) -> None:
+        # APIと同じく1リクエスト=1コミットで書き込む
+        for i in range(count):
+            async with session_factory() as db:
+                await crud_task.create_with_owner(
+                    db, obj_in=TaskCreate(title=f"Task {i}"), owner_id=1
+                )
+
+    started = time.perf_counter()
+    await writer(writes)
+    sequential = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await asyncio.gather(*(writer(writes // writers) for _ in range(writers)))
+    concurrent = time.perf_counter() - started
+    await engine.dispose()
+    return {
+        "sequential": writes / sequential,
+        "concurrent": writes // writers * writers / concurrent,
+    }
+
+
+async def main(writes: int, writers: int) -> None:
+    # 比較のため、SQLITE_TUNING の値にかかわらず SQLITE_* の設定を使う
+    settings.SQLITE_TUNING = True
+    tuned = sqlite_pragmas("sqlite://")
+    profiles = {"default": {}, "tuned": tuned}
+    results = {}
+    for name, pragmas in profiles.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.db")
+            seed(path)
+            results[name] = await measure(path, pragmas, writes, writers)
+
+    print(f"{writes} single-row commits, {writers} concurrent writers")
+    print(f"{'profile':<9}{'seq writes/s':>14}{'conc writes/s':>15}")
+    for name, r in results.items():
+        print(f"{name:<9}{r['sequential']:>14.0f}{r['concurrent']:>15.0f}")
+    print("tuned PRAGMAs: " + ", ".join(f"{k}={v}" for k, v in tuned.items()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--writers", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.writes, args.writers))
@@ -0,0 +1,93 @@
+# benchmarks/bench_task_rows.py
+"""
+Compare the ORM list path (`get_tasks_by_owner`) with the Core row path
+(`get_rows_by_owner`) on one large page: wall time per page and peak memory.
+
+Usage:
+    python -m benchmarks.bench_task_rows --rows 20000 --page 1000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.api.responses import TaskJSONResponse  # noqa: E402
+from app.crud.task import task as crud_task  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.models.task import Task  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+
+def seed(path: str, rows: int) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(
+            User.__table__.insert(), [{"email": "bench@example.com", "hashed_password": "x"}]
+        )
+        connection.execute(
+            Task.__table__.insert(),
+            [
+                {"title": f"Task {i}", "description": f"Description {i}", "owner_id": 1}
+                for i in range(rows)
+            ],
+        )
+    engine.dispose()
+
+
+async def measure(session_factory, read, page: int, repeat: int) -> dict[str, float]:
+    async def read_page() -> bytes:
+        async with session_factory() as db:
+            return TaskJSONResponse(await read(db, owner_id=1, limit=page)).body
+
+    await read_page()  # ウォームアップ
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await read_page()
+    elapsed = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    await read_page()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "ms_per_page": elapsed * 1000,
+        "us_per_row": elapsed / page * 1e6,
+        "peak_kib": peak / 1024,
+    }
+
+
+async def main(rows: int, page: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        seed(path, rows)
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        results = {
+            "orm": await measure(session_factory, crud_task.get_tasks_by_owner, page, repeat),
+            "rows": await measure(session_factory, crud_task.get_rows_by_owner, page, repeat),
+        }
+        await engine.dispose()
+
+    print(f"{rows} tasks, page={page}, repeat={repeat}")
+    print(f"{'path':<6}{'ms/page':>12}{'us/row':>10}{'peak KiB':>12}")
+    for name, r in results.items():
+        print(f"{name:<6}{r['ms_per_page']:>12.2f}{r['us_per_row']:>10.2f}{r['peak_kib']:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.page, args.repeat))
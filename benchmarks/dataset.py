@@ -0,0 +1,152 @@
+# benchmarks/dataset.py
+"""
+Seed a reproducible SQLite dataset for the benchmarks: users sharing one
+password, and tasks spread over them with a Zipf-like skew (a few heavy users,
+a long tail of light ones) and creation times over the past year.
+
+The seeded file is reused while its parameters (stored next to it as
+<db>.json) match.
+
+Usage:
+    python -m benchmarks.dataset --db /tmp/bench.db --users 10000 --tasks 1000000
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.security import get_password_hash  # noqa: E402
+from app.crud.task import task as crud_task  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.search import SQLITE_DDL, SQLITE_FTS_TABLE  # noqa: E402
+from app.models import task, task_counter, user  # noqa: F401,E402
+
+PASSWORD = "benchmark-password"
+CHUNK_SIZE = 50000
+WORDS = (
+    "review report draft release plan budget deploy fix test invoice meeting design "
+    "backup migrate refactor update call email schedule audit"
+).split()
+
+
+def user_email(user_id: int) -> str:
+    return f"user{user_id}@example.com"
+
+
+def owner_weights(users: int, skew: float) -> list[float]:
+    """Cumulative weights: user n gets a share proportional to 1 / n**skew."""
+    return list(itertools.accumulate(1 / n**skew for n in range(1, users + 1)))
+
+
+def _task_rows(rng: random.Random, owners: list[int], now: datetime):
+    for owner_id in owners:
+        title = " ".join(rng.choices(WORDS, k=3)).capitalize()
+        description = " ".join(rng.choices(WORDS, k=8)) if rng.random() < 0.5 else None
+        # CURRENT_TIMESTAMP（created_at の既定値）と同じ書式で入れる
+        created_at = now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+        yield (
+            title,
+            description,
+            rng.random() < 0.3,
+            owner_id,
+            created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+
+def _seed(path: str, users: int, tasks: int, seed: int, skew: float) -> None:
+    rng = random.Random(seed)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+        connection.exec_driver_sql("PRAGMA synchronous=OFF")
+        # 1行ずつトリガーで索引するより、最後にまとめて作り直す方が速い
+        for trigger in ("tasks_fts_ai", "tasks_fts_ad", "tasks_fts_au"):
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+
+        hashed_password = get_password_hash(PASSWORD)
+        connection.exec_driver_sql(
+            "INSERT INTO users (email, hashed_password, is_active) VALUES (?, ?, 1)",
+            [(user_email(i), hashed_password) for i in range(1, users + 1)],
+        )
+        cum_weights = owner_weights(users, skew)
+        now = datetime.utcnow().replace(microsecond=0)
+        for start in range(0, tasks, CHUNK_SIZE):
+            owners = rng.choices(
+                range(1, users + 1), cum_weights=cum_weights, k=min(CHUNK_SIZE, tasks - start)
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO tasks (title, description, completed, owner_id, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                list(_task_rows(rng, owners, now)),
+            )
+
+        for trigger in SQLITE_DDL[1:]:
+            connection.exec_driver_sql(trigger)
+        connection.exec_driver_sql(
+            f"INSERT INTO {SQLITE_FTS_TABLE} ({SQLITE_FTS_TABLE}) VALUES ('rebuild')"
+        )
+    engine.dispose()
+
+    asyncio.run(_rebuild_stats(path))
+
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ANALYZE")
+    engine.dispose()
+
+
+async def _rebuild_stats(path: str) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with async_sessionmaker(engine)() as db:
+        await crud_task.rebuild_stats(db)
+    await engine.dispose()
+
+
+def ensure_dataset(
+    path: str, users: int, tasks: int, seed: int = 0, skew: float = 1.1
+) -> dict:
+    """
+    Seed `path` unless it already holds this dataset; returns the dataset parameters.
+
+    Runs its own event loop, so call it outside one.
+    """
+    params = {"users": users, "tasks": tasks, "seed": seed, "skew": skew}
+    meta_path = f"{path}.json"
+    if os.path.exists(path) and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            if json.load(f) == params:
+                return params
+    for stale in (path, f"{path}-wal", f"{path}-shm", meta_path):
+        if os.path.exists(stale):
+            os.remove(stale)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    started = time.perf_counter()
+    _seed(path, users, tasks, seed, skew)
+    print(f"seeded {users} users / {tasks} tasks in {time.perf_counter() - started:.1f}s")
+    with open(meta_path, "w") as f:
+        json.dump(params, f)
+    return params
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", required=True)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skew", type=float, default=1.1)
+    args = parser.parse_args()
+    ensure_dataset(args.db, args.users, args.tasks, args.seed, args.skew)
@@ -0,0 +1,41 @@
+# tests/api/test_responses.py
+
+import json
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.api import responses
+from app.api.responses import TaskJSONResponse
+from app.models.task import Task as DBTask
+from app.schemas.task import Task
+
+TASKS = [
+    DBTask(id=1, title="Task 1", description="説明 \"quoted\"\n", completed=False, owner_id=7),
+    DBTask(id=2, title="Task 2", description=None, completed=True, owner_id=7),
+]
+
+
+def schema_response_body(content) -> bytes:
+    # FastAPI が response_model で検証・エンコードした場合の出力
+    adapter = TypeAdapter(list[Task] if isinstance(content, list) else Task)
+    validated = adapter.validate_python(content, from_attributes=True)
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def test_task_list_matches_schema_output() -> None:
+    body = TaskJSONResponse(TASKS).body
+    assert body == schema_response_body(TASKS)
+    assert TypeAdapter(list[Task]).validate_json(body)[1].description is None
+
+
+def test_single_task_matches_schema_output() -> None:
+    assert TaskJSONResponse(TASKS[0]).body == schema_response_body(TASKS[0])
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch) -> None:
+    fast = TaskJSONResponse(TASKS).body
+    monkeypatch.setattr(responses, "orjson", None)
+    assert TaskJSONResponse(TASKS).body == fast
+    assert json.loads(fast)[0]["title"] == "Task 1"
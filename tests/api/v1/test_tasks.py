@@ -1,10 +1,26 @@
 # tests/api/v1/test_tasks.py
 
+import asyncio
+import csv
+import io
+import json
+
 from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.core.pagination import encode_cursor
+from app.db.base import Base
+from app.db.pool import PoolTelemetry
+from app.db.routing import DatabaseRouter
+from app.db.session import get_db_router
+from app.main import app
+from app.models.task import Task
 from app.schemas.user import UserCreate
+from tests.conftest import TestingAsyncSessionLocal, async_engine
 
 
 def get_authenticated_user_token(client: TestClient, email: str, password: str) -> str:
@@ -241,3 +257,619 @@ def test_delete_task_forbidden(client: TestClient) -> None:
 
 
 
+
+
+def test_read_user_tasks_cursor_pagination(client: TestClient) -> None:
+    email = "cursor_owner@example.com"
+    token = get_authenticated_user_token(client, email, "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for i in range(5):
+        client.post(
+            f"{settings.API_V1_STR}/tasks/",
+            headers=headers,
+            json={"title": f"Task {i}", "description": None},
+        )
+
+    # 1ページ目（skip/limit）でも次ページ用のカーソルが返る
+    r = client.get(f"{settings.API_V1_STR}/tasks/?limit=2", headers=headers)
+    assert r.status_code == 200
+    titles = [t["title"] for t in r.json()]
+    cursor = r.headers["X-Next-Cursor"]
+
+    while cursor:
+        r = client.get(
+            f"{settings.API_V1_STR}/tasks/",
+            headers=headers,
+            params={"cursor": cursor, "limit": 2},
+        )
+        assert r.status_code == 200
+        titles += [t["title"] for t in r.json()]
+        cursor = r.headers.get("X-Next-Cursor")
+
+    assert titles == [f"Task {i}" for i in range(5)]
+
+
+def test_read_user_tasks_invalid_cursor(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "bad_cursor@example.com", "password123")
+    for cursor in ("not-a-cursor", encode_cursor({"id": True}), encode_cursor({"id": "1"})):
+        r = client.get(
+            f"{settings.API_V1_STR}/tasks/",
+            headers={"Authorization": f"Bearer {token}"},
+            params={"cursor": cursor},
+        )
+        assert r.status_code == 400
+        assert r.json()["detail"] == "Invalid cursor"
+
+
+def set_created_at(created_at: dict[int, str]) -> None:
+    # CURRENT_TIMESTAMP と同じ書式で作成日時を書き換える
+    async def run() -> None:
+        async with async_engine.begin() as connection:
+            await connection.execute(
+                text("UPDATE tasks SET created_at = :created_at WHERE id = :id"),
+                [{"id": id, "created_at": value} for id, value in created_at.items()],
+            )
+
+    asyncio.run(run())
+
+
+def test_read_user_tasks_filter_and_sort(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "list_filter@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    tasks = client.post(
+        f"{settings.API_V1_STR}/tasks/bulk",
+        headers=headers,
+        json=[{"title": title} for title in ["Alpha", "Beta", "Gamma", "Delta", "alpha two"]],
+    ).json()
+    a, b, c, d, e = (t["id"] for t in tasks)
+    set_created_at(
+        {
+            a: "2026-01-03 00:00:00",
+            b: "2026-01-01 00:00:00",
+            c: "2026-01-02 00:00:00",
+            d: "2026-01-02 00:00:00",
+            e: "2026-01-01 00:00:00",
+        }
+    )
+    client.patch(
+        f"{settings.API_V1_STR}/tasks/",
+        headers=headers,
+        params={"ids": [c, e]},
+        json={"completed": True},
+    )
+
+    def ids(**params) -> list[int]:
+        r = client.get(f"{settings.API_V1_STR}/tasks/", headers=headers, params=params)
+        assert r.status_code == 200
+        return [t["id"] for t in r.json()]
+
+    assert ids() == [a, b, c, d, e]
+    assert ids(sort="-id") == [e, d, c, b, a]
+    # 作成日時が同じなら id 順
+    assert ids(sort="created_at") == [b, e, c, d, a]
+    assert ids(sort="-created_at") == [a, d, c, e, b]
+    assert ids(completed=False, sort="created_at") == [b, d, a]
+    assert ids(completed=True) == [c, e]
+    # created_after は境界を含み、created_before は含まない
+    assert ids(created_after="2026-01-02T00:00:00", sort="created_at") == [c, d, a]
+    assert ids(created_before="2026-01-02T00:00:00") == [b, e]
+    assert ids(created_after="2026-01-02T09:00:00+09:00", created_before="2026-01-03") == [c, d]
+    # 前方一致は大文字小文字を区別する
+    assert ids(title_prefix="Alpha") == [a]
+    assert ids(title_prefix="alpha") == [e]
+    assert ids(title_prefix="%") == []
+    assert ids(completed=False, created_after="2026-01-02", title_prefix="Delta") == [d]
+
+    r = client.get(f"{settings.API_V1_STR}/tasks/", headers=headers, params={"sort": "title"})
+    assert r.status_code == 422
+
+
+def test_read_user_tasks_cursor_pagination_sorted(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "list_cursor@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    tasks = client.post(
+        f"{settings.API_V1_STR}/tasks/bulk",
+        headers=headers,
+        json=[{"title": f"Task {i}"} for i in range(7)],
+    ).json()
+    days = ["01", "03", "02", "03", "01", "02", "03"]
+    set_created_at({t["id"]: f"2026-02-{day} 12:00:00" for t, day in zip(tasks, days)})
+    client.patch(
+        f"{settings.API_V1_STR}/tasks/",
+        headers=headers,
+        params={"ids": [tasks[3]["id"]]},
+        json={"completed": True},
+    )
+
+    for sort, params in [
+        ("-created_at", {}),
+        ("created_at", {"completed": False}),
+        ("-id", {"created_after": "2026-02-02"}),
+    ]:
+        expected = [
+            t["id"]
+            for t in client.get(
+                f"{settings.API_V1_STR}/tasks/", headers=headers, params={**params, "sort": sort}
+            ).json()
+        ]
+        ids: list[int] = []
+        page = {**params, "sort": sort, "limit": 2}
+        while True:
+            r = client.get(f"{settings.API_V1_STR}/tasks/", headers=headers, params=page)
+            assert r.status_code == 200
+            ids += [t["id"] for t in r.json()]
+            if "X-Next-Cursor" not in r.headers:
+                break
+            page["cursor"] = r.headers["X-Next-Cursor"]
+        assert ids == expected, sort
+        assert len(set(ids)) == len(ids)
+
+    # 別の並び順で発行されたカーソルは使えない
+    r = client.get(
+        f"{settings.API_V1_STR}/tasks/", headers=headers, params={"sort": "created_at", "limit": 2}
+    )
+    r = client.get(
+        f"{settings.API_V1_STR}/tasks/",
+        headers=headers,
+        params={"sort": "-created_at", "cursor": r.headers["X-Next-Cursor"]},
+    )
+    assert r.status_code == 400
+
+
+def test_create_tasks_bulk(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "bulk_owner@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    tasks_data = [{"title": f"Bulk {i}", "description": f"Desc {i}"} for i in range(3)]
+    r = client.post(f"{settings.API_V1_STR}/tasks/bulk", headers=headers, json=tasks_data)
+    assert r.status_code == 201
+    created = r.json()
+    assert [t["title"] for t in created] == [t["title"] for t in tasks_data]
+    assert all(t["completed"] is False for t in created)
+    assert len({t["id"] for t in created}) == 3
+
+    r = client.get(f"{settings.API_V1_STR}/tasks/", headers=headers)
+    assert [t["id"] for t in r.json()] == [t["id"] for t in created]
+
+
+def test_create_tasks_bulk_too_large(client: TestClient, monkeypatch) -> None:
+    token = get_authenticated_user_token(client, "bulk_limit@example.com", "password123")
+    monkeypatch.setattr(settings, "TASK_BULK_MAX_SIZE", 2)
+
+    r = client.post(
+        f"{settings.API_V1_STR}/tasks/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json=[{"title": f"Bulk {i}"} for i in range(3)],
+    )
+    assert r.status_code == 413
+
+
+def test_update_tasks_bulk_by_ids(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "bulk_update@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    created = client.post(
+        f"{settings.API_V1_STR}/tasks/bulk",
+        headers=headers,
+        json=[{"title": f"Task {i}"} for i in range(3)],
+    ).json()
+
+    # 他ユーザーのタスクは対象外
+    other_token = get_authenticated_user_token(client, "bulk_other@example.com", "password123")
+    other_task = client.post(
+        f"{settings.API_V1_STR}/tasks/",
+        headers={"Authorization": f"Bearer {other_token}"},
+        json={"title": "Other"},
+    ).json()
+
+    ids = [created[0]["id"], created[2]["id"], other_task["id"]]
+    r = client.patch(
+        f"{settings.API_V1_STR}/tasks/",
+        headers=headers,
+        params={"ids": ids},
+        json={"completed": True},
+    )
+    assert r.status_code == 200
+    assert r.json() == {"count": 2}
+
+    tasks = client.get(f"{settings.API_V1_STR}/tasks/", headers=headers).json()
+    assert [t["completed"] for t in tasks] == [True, False, True]
+
+
+def test_delete_tasks_bulk_completed(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "clear_completed@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    created = client.post(
+        f"{settings.API_V1_STR}/tasks/bulk",
+        headers=headers,
+        json=[{"title": f"Task {i}"} for i in range(3)],
+    ).json()
+    client.put(
+        f"{settings.API_V1_STR}/tasks/{created[1]['id']}",
+        headers=headers,
+        json={"title": "Task 1", "completed": True},
+    )
+
+    r = client.delete(
+        f"{settings.API_V1_STR}/tasks/", headers=headers, params={"completed": True}
+    )
+    assert r.status_code == 200
+    assert r.json() == {"count": 1}
+
+    tasks = client.get(f"{settings.API_V1_STR}/tasks/", headers=headers).json()
+    assert [t["id"] for t in tasks] == [created[0]["id"], created[2]["id"]]
+
+
+def test_bulk_operations_require_filter(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "bulk_no_filter@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    r = client.delete(f"{settings.API_V1_STR}/tasks/", headers=headers)
+    assert r.status_code == 400
+
+    r = client.patch(f"{settings.API_V1_STR}/tasks/", headers=headers, json={"completed": True})
+    assert r.status_code == 400
+
+    r = client.patch(
+        f"{settings.API_V1_STR}/tasks/",
+        headers=headers,
+        params={"completed": False},
+        json={"title": None},
+    )
+    assert r.status_code == 422
+
+
+def test_update_and_delete_task_not_found(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "missing_task@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    r = client.put(f"{settings.API_V1_STR}/tasks/9999", headers=headers, json={"title": "X"})
+    assert r.status_code == 404
+    assert r.json()["detail"] == "Task not found"
+
+    r = client.delete(f"{settings.API_V1_STR}/tasks/9999", headers=headers)
+    assert r.status_code == 404
+    assert r.json()["detail"] == "Task not found"
+
+
+def test_export_tasks_ndjson(client: TestClient, monkeypatch) -> None:
+    # バッチ境界をまたぐ件数で確認する
+    monkeypatch.setattr(settings, "TASK_EXPORT_BATCH_SIZE", 2)
+    token = get_authenticated_user_token(client, "export_owner@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    created = client.post(
+        f"{settings.API_V1_STR}/tasks/bulk",
+        headers=headers,
+        json=[{"title": f"Task {i}", "description": "改行\nあり"} for i in range(5)],
+    ).json()
+    other_token = get_authenticated_user_token(client, "export_other@example.com", "password123")
+    client.post(
+        f"{settings.API_V1_STR}/tasks/",
+        headers={"Authorization": f"Bearer {other_token}"},
+        json={"title": "Other"},
+    )
+
+    r = client.get(f"{settings.API_V1_STR}/tasks/export", headers=headers)
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    lines = r.content.splitlines()
+    assert [json.loads(line) for line in lines] == created
+
+
+def test_export_tasks_csv(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "export_csv@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    created = client.post(
+        f"{settings.API_V1_STR}/tasks/bulk",
+        headers=headers,
+        json=[{"title": "A, with comma"}, {"title": "B", "description": "x"}],
+    ).json()
+
+    r = client.get(f"{settings.API_V1_STR}/tasks/export?format=csv", headers=headers)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(r.text)))
+    assert [row["title"] for row in rows] == ["A, with comma", "B"]
+    assert [int(row["id"]) for row in rows] == [t["id"] for t in created]
+    assert rows[0]["description"] == ""
+
+
+def test_import_tasks_ndjson_reports_bad_lines(client: TestClient, monkeypatch) -> None:
+    # バッチ境界をまたぐ件数で確認する
+    monkeypatch.setattr(settings, "TASK_IMPORT_BATCH_SIZE", 2)
+    token = get_authenticated_user_token(client, "import_owner@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    body = "\n".join(
+        [
+            json.dumps({"title": "Task 1"}),
+            "{not json",
+            json.dumps({"title": "Task 2", "description": "desc"}),
+            "",
+            json.dumps({"description": "no title"}),
+            json.dumps({"title": "Task 3"}),
+            json.dumps({"title": "Task 4"}),
+        ]
+    )
+
+    r = client.post(f"{settings.API_V1_STR}/tasks/import", headers=headers, content=body)
+    assert r.status_code == 200
+    result = r.json()
+    assert result["imported"] == 4
+    assert result["failed"] == 2
+    assert [error["line"] for error in result["errors"]] == [2, 5]
+    assert result["errors"][1]["error"].startswith("title:")
+
+    tasks = client.get(f"{settings.API_V1_STR}/tasks/", headers=headers).json()
+    assert [t["title"] for t in tasks] == ["Task 1", "Task 2", "Task 3", "Task 4"]
+    assert all(t["completed"] is False for t in tasks)
+
+
+def test_import_tasks_round_trips_csv_export(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "import_csv@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post(
+        f"{settings.API_V1_STR}/tasks/bulk",
+        headers=headers,
+        json=[{"title": "A, with comma"}, {"title": "B", "description": "改行\nあり"}],
+    )
+    exported = client.get(f"{settings.API_V1_STR}/tasks/export?format=csv", headers=headers)
+
+    other_token = get_authenticated_user_token(client, "import_csv2@example.com", "password123")
+    other_headers = {"Authorization": f"Bearer {other_token}"}
+    r = client.post(
+        f"{settings.API_V1_STR}/tasks/import?format=csv",
+        headers=other_headers,
+        content=exported.content,
+    )
+    assert r.status_code == 200
+    assert r.json() == {"imported": 2, "failed": 0, "errors": []}
+    tasks = client.get(f"{settings.API_V1_STR}/tasks/", headers=other_headers).json()
+    assert [(t["title"], t["description"]) for t in tasks] == [
+        ("A, with comma", None),
+        ("B", "改行\nあり"),
+    ]
+
+
+def test_import_tasks_skips_oversized_lines(client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "TASK_IMPORT_MAX_LINE_BYTES", 64)
+    monkeypatch.setattr(settings, "TASK_IMPORT_MAX_ERRORS", 1)
+    token = get_authenticated_user_token(client, "import_big@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    long_line = json.dumps({"title": "x" * 200})
+
+    def chunks():
+        # 行の途中でチャンクが切れても正しく分割されること
+        body = "\n".join([long_line, json.dumps({"title": "ok"}), long_line]).encode()
+        for i in range(0, len(body), 7):
+            yield body[i : i + 7]
+
+    r = client.post(f"{settings.API_V1_STR}/tasks/import", headers=headers, content=chunks())
+    assert r.status_code == 200
+    result = r.json()
+    assert result["imported"] == 1
+    assert result["failed"] == 2
+    assert result["errors"] == [{"line": 1, "error": "Line exceeds 64 bytes"}]
+
+
+def test_reads_go_to_replica_until_client_writes(client: TestClient, tmp_path) -> None:
+    # プライマリ（test.db）とは別のSQLiteファイルをレプリカとして使う
+    replica_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}", poolclass=NullPool
+    )
+    replica = async_sessionmaker(bind=replica_engine, expire_on_commit=False)
+    router = DatabaseRouter(
+        TestingAsyncSessionLocal, replicas=[(replica, PoolTelemetry())], pin_seconds=60
+    )
+    app.dependency_overrides[get_db_router] = lambda: router
+
+    token = get_authenticated_user_token(client, "replica_user@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = client.get(f"{settings.API_V1_STR}/users/me", headers=headers).json()["id"]
+
+    async def seed_replica() -> None:
+        async with replica_engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await connection.execute(
+                Task.__table__.insert(), [{"title": "From replica", "owner_id": user_id}]
+            )
+        await replica_engine.dispose()
+
+    asyncio.run(seed_replica())
+
+    r = client.get(f"{settings.API_V1_STR}/tasks/", headers=headers)
+    assert [t["title"] for t in r.json()] == ["From replica"]
+
+    client.post(f"{settings.API_V1_STR}/tasks/", headers=headers, json={"title": "Written"})
+    r = client.get(f"{settings.API_V1_STR}/tasks/", headers=headers)
+    assert [t["title"] for t in r.json()] == ["Written"]
+
+
+def test_task_list_etag_returns_304_until_tasks_change(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "etag_owner@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post(f"{settings.API_V1_STR}/tasks/", headers=headers, json={"title": "First"})
+
+    r = client.get(f"{settings.API_V1_STR}/tasks/", headers=headers)
+    assert r.status_code == 200
+    etag = r.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        r = client.get(
+            f"{settings.API_V1_STR}/tasks/", headers={**headers, "If-None-Match": etag}
+        )
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["ETag"] == etag
+    # 304 のときはタスク本体を読まない
+    assert not [s for s in statements if "FROM tasks" in s]
+
+    # 他のユーザーの書き込みではETagは変わらない
+    other_token = get_authenticated_user_token(client, "etag_other@example.com", "password123")
+    other_task = client.post(
+        f"{settings.API_V1_STR}/tasks/",
+        headers={"Authorization": f"Bearer {other_token}"},
+        json={"title": "Other"},
+    ).json()
+    r = client.get(f"{settings.API_V1_STR}/tasks/", headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 304
+
+    # 何も更新しなかった書き込み（403・404）でも変わらない
+    for task_id, status_code in ((other_task["id"], 403), (999999, 404)):
+        r = client.put(
+            f"{settings.API_V1_STR}/tasks/{task_id}",
+            headers=headers,
+            json={"title": "X", "completed": True},
+        )
+        assert r.status_code == status_code
+    r = client.get(f"{settings.API_V1_STR}/tasks/", headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 304
+
+    client.patch(
+        f"{settings.API_V1_STR}/tasks/?completed=false", headers=headers, json={"completed": True}
+    )
+    r = client.get(f"{settings.API_V1_STR}/tasks/", headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["ETag"] != etag
+    assert r.json()[0]["completed"] is True
+
+
+def test_task_detail_etag(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "etag_detail@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    task = client.post(
+        f"{settings.API_V1_STR}/tasks/", headers=headers, json={"title": "Detail"}
+    ).json()
+    url = f"{settings.API_V1_STR}/tasks/{task['id']}"
+
+    etag = client.get(url, headers=headers).headers["ETag"]
+    assert client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 304
+    assert client.get(url, headers={**headers, "If-None-Match": "*"}).status_code == 304
+
+    # ETagはタスクごと。他のタスクや存在しないタスクには一致しない
+    other_token = get_authenticated_user_token(
+        client, "etag_detail_other@example.com", "password123"
+    )
+    other_task = client.post(
+        f"{settings.API_V1_STR}/tasks/",
+        headers={"Authorization": f"Bearer {other_token}"},
+        json={"title": "Other"},
+    ).json()
+    for task_id, status_code in ((other_task["id"], 403), (999999, 404)):
+        for if_none_match in (etag, "*"):
+            r = client.get(
+                f"{settings.API_V1_STR}/tasks/{task_id}",
+                headers={**headers, "If-None-Match": if_none_match},
+            )
+            assert r.status_code == status_code
+
+    client.delete(url, headers=headers)
+    r = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 404
+
+
+def test_task_stats(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "stats_owner@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    tasks = client.post(
+        f"{settings.API_V1_STR}/tasks/bulk",
+        headers=headers,
+        json=[{"title": f"Task {i}"} for i in range(4)],
+    ).json()
+    client.patch(
+        f"{settings.API_V1_STR}/tasks/?ids={tasks[0]['id']}&ids={tasks[1]['id']}",
+        headers=headers,
+        json={"completed": True},
+    )
+    client.delete(f"{settings.API_V1_STR}/tasks/{tasks[2]['id']}", headers=headers)
+
+    r = client.get(f"{settings.API_V1_STR}/tasks/stats", headers=headers)
+    assert r.status_code == 200
+    stats = r.json()
+    assert (stats["total"], stats["completed"], stats["open"]) == (3, 2, 1)
+    assert [bucket["count"] for bucket in stats["created_per_day"]] == [3]
+
+    r = client.get(f"{settings.API_V1_STR}/tasks/stats?days=0", headers=headers)
+    assert r.status_code == 422
+
+
+def test_search_tasks(client: TestClient) -> None:
+    token = get_authenticated_user_token(client, "search_owner@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    tasks = client.post(
+        f"{settings.API_V1_STR}/tasks/bulk",
+        headers=headers,
+        json=[
+            {"title": "Write report", "description": "quarterly numbers"},
+            {"title": "Buy milk", "description": None},
+            {"title": "Call Bob", "description": "about the report deadline"},
+            {"title": "Report bug", "description": "search is slow"},
+        ],
+    ).json()
+    other_token = get_authenticated_user_token(client, "search_other@example.com", "password123")
+    client.post(
+        f"{settings.API_V1_STR}/tasks/",
+        headers={"Authorization": f"Bearer {other_token}"},
+        json={"title": "Other report"},
+    )
+    url = f"{settings.API_V1_STR}/tasks/search"
+
+    r = client.get(url, headers=headers, params={"q": "report"})
+    assert r.status_code == 200
+    # タイトルの一致が説明文の一致より上位。他人のタスクは含まない
+    titles = [t["title"] for t in r.json()]
+    assert set(titles) == {"Write report", "Call Bob", "Report bug"}
+    assert titles[-1] == "Call Bob"
+
+    # 全語の一致が必要。記号はクエリ構文として解釈しない
+    r = client.get(url, headers=headers, params={"q": 'report "deadline" -('})
+    assert [t["title"] for t in r.json()] == ["Call Bob"]
+
+    page = client.get(url, headers=headers, params={"q": "report", "skip": 2, "limit": 2}).json()
+    assert [t["title"] for t in page] == ["Call Bob"]
+
+    # 更新・削除が索引に反映される
+    client.put(
+        f"{settings.API_V1_STR}/tasks/{tasks[1]['id']}",
+        headers=headers,
+        json={"title": "Buy oat milk", "completed": False},
+    )
+    client.delete(f"{settings.API_V1_STR}/tasks/{tasks[0]['id']}", headers=headers)
+    assert [t["title"] for t in client.get(url, headers=headers, params={"q": "oat"}).json()] == [
+        "Buy oat milk"
+    ]
+    assert len(client.get(url, headers=headers, params={"q": "report"}).json()) == 2
+
+    assert client.get(url, headers=headers, params={"q": "!!"}).json() == []
+    assert client.get(url, headers=headers, params={"q": ""}).status_code == 422
+
+
+def test_task_endpoint_query_budgets(client: TestClient, assert_query_budget) -> None:
+    token = get_authenticated_user_token(client, "budget_owner@example.com", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+    url = f"{settings.API_V1_STR}/tasks"
+    # 認証時のユーザー参照はキャッシュされるため、先に済ませておく
+    client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+
+    # INSERT + 件数カウンタ + 日別カウンタ。件数によらず一定
+    r = client.post(f"{url}/bulk", headers=headers, json=[{"title": "Task"}] * 50)
+    assert_query_budget(r, 3)
+    task_id = r.json()[0]["id"]
+    assert_query_budget(client.post(f"{url}/", headers=headers, json={"title": "One"}), 3)
+    # バージョン（ETag）+ 本体
+    assert_query_budget(client.get(f"{url}/", headers=headers), 2)
+    assert_query_budget(client.get(f"{url}/", headers=headers, params={"sort": "-created_at"}), 2)
+    assert_query_budget(client.get(f"{url}/{task_id}", headers=headers), 2)
+    assert_query_budget(client.get(f"{url}/search", headers=headers, params={"q": "task"}), 1)
+    assert_query_budget(client.get(f"{url}/stats", headers=headers), 2)
+    r = client.put(f"{url}/{task_id}", headers=headers, json={"title": "T", "completed": True})
+    assert_query_budget(r, 2)
+    assert_query_budget(client.delete(f"{url}/{task_id}", headers=headers), 3)
@@ -1,10 +1,19 @@
 # tests/api/v1/test_users.py
 
+import asyncio
+
 from fastapi.testclient import TestClient
+from sqlalchemy import event, update
 from sqlalchemy.orm import Session
 
+from app.auth.cache import principal_cache
+from app.auth.revocation import revocation_list
 from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.crud.user import user as crud_user
+from app.models.user import User
 from app.schemas.user import UserCreate
+from tests.conftest import TestingAsyncSessionLocal, async_engine
 
 
 def test_create_user(client: TestClient) -> None:
@@ -83,3 +92,101 @@ def test_read_users_me_unauthorized(client: TestClient) -> None:
 
 
 
+
+
+def test_read_users_me_uses_principal_cache(client: TestClient) -> None:
+    user_data = {"email": "cached_me@example.com", "password": "password123"}
+    client.post(f"{settings.API_V1_STR}/users/", json=user_data)
+    login_r = client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={"username": user_data["email"], "password": user_data["password"]},
+    )
+    headers = {"Authorization": f"Bearer {login_r.json()['access_token']}"}
+
+    client.get(f"{settings.API_V1_STR}/users/me/", headers=headers)
+    hits = principal_cache.hits
+    r = client.get(f"{settings.API_V1_STR}/users/me/", headers=headers)
+    assert r.status_code == 200
+    assert r.json()["email"] == user_data["email"]
+    assert principal_cache.hits == hits + 1
+
+    # ユーザー更新でキャッシュが破棄され、無効化が即時に反映される
+    async def deactivate() -> None:
+        async with TestingAsyncSessionLocal() as db:
+            db_user = await crud_user.get_by_email(db, email=user_data["email"])
+            await crud_user.update(db, db_obj=db_user, obj_in={"is_active": False})
+
+    asyncio.run(deactivate())
+    assert principal_cache.get(user_data["email"]) is None
+    r = client.get(f"{settings.API_V1_STR}/users/me/", headers=headers)
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Inactive user"
+
+
+def test_login_returns_503_when_hash_pool_saturated(client: TestClient, monkeypatch) -> None:
+    user_data = {"email": "busy_login@example.com", "password": "password123"}
+    client.post(f"{settings.API_V1_STR}/users/", json=user_data)
+
+    # ワーカー・待ち行列ともに埋まっている状態を再現
+    saturated = password_hasher.workers + password_hasher.max_queue
+    monkeypatch.setattr(password_hasher, "in_flight", saturated)
+    r = client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={"username": user_data["email"], "password": user_data["password"]},
+    )
+    assert r.status_code == 503
+    assert r.headers["Retry-After"] == "1"
+
+
+def test_stateless_auth_skips_user_lookup(client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+    monkeypatch.setattr(revocation_list, "refresh_interval", 3600)
+    user_data = {"email": "stateless@example.com", "password": "password123"}
+    client.post(f"{settings.API_V1_STR}/users/", json=user_data)
+    login_r = client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={"username": user_data["email"], "password": user_data["password"]},
+    )
+    headers = {"Authorization": f"Bearer {login_r.json()['access_token']}"}
+
+    # 初回のみ無効化ユーザー一覧を取得し、以降は認証でDBを参照しない
+    client.get(f"{settings.API_V1_STR}/users/me/", headers=headers)
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        r = client.get(f"{settings.API_V1_STR}/users/me/", headers=headers)
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    assert r.status_code == 200
+    assert r.json()["email"] == user_data["email"]
+    assert statements == []
+
+
+def test_stateless_auth_picks_up_deactivation_from_db(client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+    monkeypatch.setattr(revocation_list, "refresh_interval", 0)
+    user_data = {"email": "stateless_revoked@example.com", "password": "password123"}
+    client.post(f"{settings.API_V1_STR}/users/", json=user_data)
+    login_r = client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={"username": user_data["email"], "password": user_data["password"]},
+    )
+    headers = {"Authorization": f"Bearer {login_r.json()['access_token']}"}
+    assert client.get(f"{settings.API_V1_STR}/users/me/", headers=headers).status_code == 200
+
+    # 他プロセスでの無効化を想定し、CRUDを通さずDBを直接更新する
+    async def deactivate() -> None:
+        async with TestingAsyncSessionLocal() as db:
+            await db.execute(
+                update(User).where(User.email == user_data["email"]).values(is_active=False)
+            )
+            await db.commit()
+
+    asyncio.run(deactivate())
+    r = client.get(f"{settings.API_V1_STR}/users/me/", headers=headers)
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Inactive user"
@@ -0,0 +1,48 @@
+# tests/auth/test_handler.py
+
+import hashlib
+import time
+from datetime import timedelta
+
+import pytest
+from jose import JWTError
+
+from app.auth.cache import claims_cache
+from app.auth.handler import decode_access_token
+from app.core.security import create_access_token
+
+
+@pytest.fixture(autouse=True)
+def clear_claims_cache():
+    claims_cache.clear()
+    yield
+    claims_cache.clear()
+
+
+def test_decode_access_token_reuses_verified_claims() -> None:
+    token = create_access_token(subject="claims@example.com")
+    claims = decode_access_token(token)
+    assert claims["sub"] == "claims@example.com"
+
+    hits = claims_cache.hits
+    assert decode_access_token(token) is claims
+    assert claims_cache.hits == hits + 1
+
+
+def test_cached_claims_do_not_outlive_token_expiry(monkeypatch) -> None:
+    token = create_access_token(subject="short@example.com", expires_delta=timedelta(seconds=5))
+    decode_access_token(token)
+    key = hashlib.sha256(token.encode()).digest()
+    assert claims_cache.get(key) is not None
+
+    # 設定上のTTL（数十分）ではなく、トークンのexpでキャッシュが切れる
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+    assert claims_cache.get(key) is None
+
+
+def test_invalid_token_is_not_cached() -> None:
+    token = create_access_token(subject="tampered@example.com") + "x"
+    with pytest.raises(JWTError):
+        decode_access_token(token)
+    assert len(claims_cache) == 0
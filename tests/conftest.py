@@ -3,14 +3,23 @@
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+# テストは test.db を使うため、起動時のPRAGMA確認で sql_app.db を開かない
+os.environ.setdefault("SQLITE_TUNING", "false")
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
+from app.auth.cache import claims_cache, principal_cache
+from app.auth.revocation import revocation_list
+from app.core.config import settings
+from app.core.profiling import QUERY_COUNT_HEADER
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.routing import DatabaseRouter
+from app.db.session import get_db, get_db_router, get_session_factory
 from app.main import app
 
 
@@ -22,6 +31,16 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClientはテストごとに別のイベントループで動くため、接続はプールしない
+async_engine = create_async_engine(
+    "sqlite+aiosqlite:///./test.db",
+    connect_args={"check_same_thread": False},
+    poolclass=NullPool,
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 @pytest.fixture(name="db")
 def session_fixture():
@@ -36,13 +55,37 @@ def session_fixture():
 
 @pytest.fixture(name="client")
 def client_fixture(db: TestingSessionLocal):
-    def override_get_db():
-        yield db
+    async def override_get_db():
+        async with TestingAsyncSessionLocal() as async_db:
+            yield async_db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingAsyncSessionLocal
+    testing_router = DatabaseRouter(TestingAsyncSessionLocal)
+    app.dependency_overrides[get_db_router] = lambda: testing_router
+    # テスト間でDBを作り直すため、プロセス内キャッシュも毎回空にする
+    principal_cache.clear()
+    claims_cache.clear()
+    revocation_list.clear()
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(name="assert_query_budget")
+def assert_query_budget_fixture(monkeypatch):
+    """
+    Turn on DB_PROFILING and return `check(response, max_queries)`, which fails if
+    the request that produced `response` ran more SQL statements than its budget.
+    """
+    monkeypatch.setattr(settings, "DB_PROFILING", True)
+
+    def check(response, max_queries: int) -> int:
+        count = int(response.headers[QUERY_COUNT_HEADER])
+        request = response.request
+        assert count <= max_queries, (
+            f"{request.method} {request.url.path} ran {count} queries (budget {max_queries})"
+        )
+        return count
 
+    return check
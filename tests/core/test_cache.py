@@ -0,0 +1,44 @@
+# tests/core/test_cache.py
+
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_lru_eviction() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" を最近使用に
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 3, "misses": 1, "evictions": 1}
+
+
+def test_entries_expire(monkeypatch) -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    now = time.monotonic()
+    cache.set("default", 1)
+    cache.set("short", 2, ttl=1)
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 30)
+    assert cache.get("short") is None
+    assert cache.get("default") == 1
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert cache.get("default") is None
+    assert len(cache) == 0
+
+
+def test_pop_and_disabled_cache() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.get("a") is None
+
+    disabled: TTLCache[str, int] = TTLCache(maxsize=0, ttl=60)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
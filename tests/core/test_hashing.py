@@ -0,0 +1,68 @@
+# tests/core/test_hashing.py
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.hashing import PasswordHashPool, PasswordHashPoolBusy
+
+
+def test_hash_and_verify_round_trip() -> None:
+    pool = PasswordHashPool(workers=1, use_processes=False, max_queue=1, timeout=10)
+
+    async def run() -> tuple[bool, bool]:
+        hashed = await pool.hash("password123")
+        return await pool.verify("password123", hashed), await pool.verify("wrong", hashed)
+
+    try:
+        assert asyncio.run(run()) == (True, False)
+    finally:
+        pool.shutdown()
+    stats = pool.stats()
+    assert stats["completed"] == 3
+    assert stats["in_flight"] == 0
+    assert stats["latency_seconds_max"] > 0
+
+
+def test_process_pool_round_trip() -> None:
+    pool = PasswordHashPool(workers=1, use_processes=True, max_queue=1, timeout=30)
+
+    async def run() -> bool:
+        return await pool.verify("password123", await pool.hash("password123"))
+
+    try:
+        assert asyncio.run(run()) is True
+    finally:
+        pool.shutdown()
+
+
+def test_saturated_pool_rejects_immediately() -> None:
+    pool = PasswordHashPool(workers=1, use_processes=False, max_queue=1, timeout=10)
+
+    async def run() -> list:
+        jobs = [pool._run(time.sleep, 0.2) for _ in range(3)]
+        return await asyncio.gather(*jobs, return_exceptions=True)
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        pool.shutdown()
+    # 1件実行中・1件待ちまでは受け付け、3件目は即座に拒否
+    assert results[:2] == [None, None]
+    assert isinstance(results[2], PasswordHashPoolBusy)
+    assert pool.stats()["rejected"] == 1
+
+
+def test_queued_job_times_out() -> None:
+    pool = PasswordHashPool(workers=1, use_processes=False, max_queue=1, timeout=0.05)
+
+    async def run() -> None:
+        await pool._run(time.sleep, 0.5)
+
+    try:
+        with pytest.raises(PasswordHashPoolBusy):
+            asyncio.run(run())
+    finally:
+        pool.shutdown()
+    assert pool.stats()["timed_out"] == 1
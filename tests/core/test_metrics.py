@@ -0,0 +1,108 @@
+# tests/core/test_metrics.py
+
+import asyncio
+import re
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.core.metrics import RequestMetrics, request_metrics
+from app.db.query_stats import install_query_hooks, track_queries
+
+
+def sample(body: str, name: str, **labels: str) -> float:
+    """Value of the sample `name{labels}` in a Prometheus text body."""
+    rendered = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf"^{re.escape(name)}{{{re.escape(rendered)}}} (\S+)$", body, re.MULTILINE)
+    assert match, f"{name}{{{rendered}}} not found"
+    return float(match.group(1))
+
+
+def test_request_metrics_render_cumulative_histogram() -> None:
+    metrics = RequestMetrics(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 3.0):
+        metrics.observe("GET", "/items/{id}", 200, seconds, queries=2, db_seconds=0.01)
+    metrics.observe("GET", "/items/{id}", 404, 0.01)
+
+    body = metrics.render()
+    route = {"method": "GET", "route": "/items/{id}"}
+    assert sample(body, "http_requests_total", **route, status="200") == 4
+    assert sample(body, "http_requests_total", **route, status="404") == 1
+    # le は「以下」。各バケットは累積
+    assert sample(body, "http_request_duration_seconds_bucket", **route, le="0.1") == 3
+    assert sample(body, "http_request_duration_seconds_bucket", **route, le="1") == 4
+    assert sample(body, "http_request_duration_seconds_bucket", **route, le="+Inf") == 5
+    assert sample(body, "http_request_duration_seconds_count", **route) == 5
+    assert abs(sample(body, "http_request_duration_seconds_sum", **route) - 3.66) < 1e-9
+    assert sample(body, "http_request_db_queries_total", **route) == 8
+    assert "# TYPE http_request_duration_seconds histogram" in body
+
+
+def test_track_queries_counts_async_statements_and_failures(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'queries.db'}")
+    install_query_hooks()
+
+    async def run() -> tuple[int, float, int]:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            with track_queries() as stats:
+                await connection.execute(text("SELECT 1"))
+                await connection.execute(text("SELECT 2"))
+                try:
+                    await connection.execute(text("SELECT * FROM missing"))
+                except OperationalError:
+                    pass
+            await connection.execute(text("SELECT 3"))
+            pending = len(connection.info.get("query_started", []))
+        await engine.dispose()
+        return stats.count, stats.seconds, pending
+
+    count, seconds, pending = asyncio.run(run())
+    assert count == 3
+    assert seconds > 0
+    assert pending == 0
+
+
+def test_metrics_endpoint(client: TestClient) -> None:
+    request_metrics.clear()
+    client.post(
+        f"{settings.API_V1_STR}/users/",
+        json={"email": "metrics@example.com", "password": "password123"},
+    )
+    r = client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={"username": "metrics@example.com", "password": "password123"},
+    )
+    headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+    task = client.post(f"{settings.API_V1_STR}/tasks/", headers=headers, json={"title": "A"})
+    client.get(f"{settings.API_V1_STR}/tasks/", headers=headers)
+    client.get(f"{settings.API_V1_STR}/tasks/{task.json()['id']}", headers=headers)
+    client.get(f"{settings.API_V1_STR}/tasks/999999", headers=headers)
+    client.get("/no-such-path")
+    for method in ("FOOBAR", "FOOBAZ"):
+        client.request(method, f"{settings.API_V1_STR}/tasks/", headers=headers)
+
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = r.text
+    tasks = {"method": "GET", "route": f"{settings.API_V1_STR}/tasks/"}
+    task_detail = {"method": "GET", "route": f"{settings.API_V1_STR}/tasks/{{task_id}}"}
+    assert sample(body, "http_requests_total", **tasks, status="200") == 1
+    # パスパラメータは値ではなくテンプレートでまとめる
+    assert sample(body, "http_requests_total", **task_detail, status="200") == 1
+    assert sample(body, "http_requests_total", **task_detail, status="404") == 1
+    assert sample(body, "http_requests_total", method="GET", route="unmatched", status="404") == 1
+    # 未知のメソッドは1つの系列にまとめる
+    assert "FOOBAR" not in body
+    other = {"method": "other", "route": tasks["route"]}
+    assert sample(body, "http_requests_total", **other, status="405") == 2
+    assert sample(body, "http_request_db_queries_total", **tasks) >= 2
+    assert sample(body, "http_request_db_seconds_total", **tasks) > 0
+    assert sample(body, "http_request_duration_seconds_count", **tasks) == 1
+    assert sample(body, "cache_hits_total", cache="principal") >= 1
+    assert sample(body, "password_hash_completed_total", pool="default") >= 2
+    assert sample(body, "db_pool_wait_seconds_count", pool="primary") >= 0
@@ -0,0 +1,87 @@
+# tests/core/test_profiling.py
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.profiling import QueryProfilerMiddleware
+from app.db.query_stats import install_query_hooks
+
+
+@pytest.fixture(name="profiled_client")
+def profiled_client_fixture(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}", poolclass=NullPool
+    )
+    install_query_hooks()
+    app = FastAPI()
+    app.add_middleware(QueryProfilerMiddleware)
+
+    @app.get("/items/{count}")
+    async def read_items(count: int) -> dict:
+        # 1件ずつ取得する典型的な N+1
+        async with engine.connect() as connection:
+            for i in range(count):
+                await connection.execute(text("SELECT :i"), {"i": i})
+        return {"count": count}
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_profiling_headers_and_n_plus_one_warning(
+    profiled_client: TestClient, monkeypatch, caplog
+) -> None:
+    monkeypatch.setattr(settings, "DB_PROFILING", True)
+    monkeypatch.setattr(settings, "DB_N_PLUS_ONE_THRESHOLD", 5)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.profiling"):
+        r = profiled_client.get("/items/4")
+    assert r.headers["X-DB-Query-Count"] == "4"
+    assert float(r.headers["X-DB-Time"]) > 0
+    assert not caplog.records
+
+    with caplog.at_level(logging.WARNING, logger="app.core.profiling"):
+        r = profiled_client.get("/items/6")
+    assert r.headers["X-DB-Query-Count"] == "6"
+    [record] = caplog.records
+    assert "GET /items/6" in record.getMessage()
+    assert "executed 6 times: SELECT ?" in record.getMessage()
+
+
+def test_profiling_off_adds_no_headers(profiled_client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "DB_PROFILING", False)
+    r = profiled_client.get("/items/2")
+    assert r.status_code == 200
+    assert "X-DB-Query-Count" not in r.headers
+
+
+def test_slow_query_log(profiled_client: TestClient, monkeypatch, caplog) -> None:
+    monkeypatch.setattr(settings, "DB_PROFILING", True)
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_MS", 1e-6)
+    with caplog.at_level(logging.WARNING, logger="app.db.query_stats"):
+        profiled_client.get("/items/1")
+    [record] = caplog.records
+    assert record.getMessage().startswith("Slow query (")
+    assert "in GET /items/1: SELECT ? parameters=(0,)" in record.getMessage()
+
+    # プロファイリング無効時はパラメータを出さない
+    caplog.clear()
+    monkeypatch.setattr(settings, "DB_PROFILING", False)
+    with caplog.at_level(logging.WARNING, logger="app.db.query_stats"):
+        profiled_client.get("/items/1")
+    [record] = caplog.records
+    assert record.getMessage().endswith(": SELECT ?")
+    assert "parameters" not in record.getMessage()
+
+    caplog.clear()
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_MS", 0)
+    with caplog.at_level(logging.WARNING, logger="app.db.query_stats"):
+        profiled_client.get("/items/1")
+    assert not caplog.records
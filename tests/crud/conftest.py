@@ -0,0 +1,39 @@
+# tests/crud/conftest.py
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.db.base import Base
+from app.models.user import User
+
+
+@pytest.fixture(name="crud_engine")
+def crud_engine_fixture(tmp_path):
+    """
+    Blocking engine on a fresh database file with the schema and three users
+    (ids 1-3, owner0@example.com ...), for seeding and EXPLAIN QUERY PLAN.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'crud.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(
+            User.__table__.insert(),
+            [{"email": f"owner{i}@example.com", "hashed_password": "x"} for i in range(3)],
+        )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="session_factory")
+def session_factory_fixture(crud_engine):
+    """Async sessions on the `crud_engine` database, for the CRUD calls under test."""
+    # 接続をプールしないため、テストごとに asyncio.run で別のイベントループを使ってよい
+    async_engine = create_async_engine(
+        crud_engine.url.set(drivername="sqlite+aiosqlite"), poolclass=NullPool
+    )
+    yield async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    asyncio.run(async_engine.dispose())
@@ -0,0 +1,185 @@
+# tests/crud/test_query_plans.py
+
+import asyncio
+import itertools
+import re
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable
+
+import pytest
+from sqlalchemy import Connection, event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.task import task as crud_task
+from app.crud.user import user as crud_user
+from app.models.task import Task
+from app.schemas.task import TaskFilter, TaskSort, TaskUpdate
+
+# "SCAN tasks" はテーブル全件走査。"SCAN tasks USING INDEX ..." はインデックス走査なので許容
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+CrudCall = Callable[[AsyncSession], Awaitable[Any]]
+
+CRUD_QUERIES: dict[str, CrudCall] = {
+    "task.get": lambda db: crud_task.get(db, id=1),
+    "task.get_tasks_by_owner": lambda db: crud_task.get_tasks_by_owner(
+        db, owner_id=1, skip=10, limit=10
+    ),
+    "task.get_tasks_by_owner_after": lambda db: crud_task.get_tasks_by_owner_after(
+        db, owner_id=1, after_id=10, limit=10
+    ),
+    "task.get_rows_by_owner": lambda db: crud_task.get_rows_by_owner(
+        db, owner_id=1, skip=10, limit=10
+    ),
+    "task.get_rows_by_owner_after": lambda db: crud_task.get_rows_by_owner_after(
+        db, owner_id=1, after_id=10, limit=10
+    ),
+    "task.update_owned": lambda db: crud_task.update_owned(
+        db, id=1, owner_id=1, obj_in=TaskUpdate(title="Updated", completed=True)
+    ),
+    "task.remove_owned": lambda db: crud_task.remove_owned(db, id=4, owner_id=1),
+    "task.get_owner_id": lambda db: crud_task.get_owner_id(db, id=1),
+    "task.search_rows_by_owner": lambda db: crud_task.search_rows_by_owner(
+        db, owner_id=1, query="Task 3"
+    ),
+    "task.get_version": lambda db: crud_task.get_version(db, owner_id=1),
+    "task.get_stats": lambda db: crud_task.get_stats(db, owner_id=1, since=date(2026, 1, 1)),
+    "task.update_by_filter": lambda db: crud_task.update_by_filter(
+        db, owner_id=1, task_filter=TaskFilter(completed=False), values={"completed": True}
+    ),
+    "task.remove_by_filter": lambda db: crud_task.remove_by_filter(
+        db, owner_id=1, task_filter=TaskFilter(ids=[1, 4])
+    ),
+    "user.get": lambda db: crud_user.get(db, id=1),
+    "user.get_by_email": lambda db: crud_user.get_by_email(db, email="owner0@example.com"),
+    "user.get_inactive_ids": lambda db: crud_user.get_inactive_ids(db, limit=100),
+}
+
+
+def full_table_scans(connection: Connection, statement: str, parameters: Any) -> list[str]:
+    """Return the tables that SQLite's EXPLAIN QUERY PLAN reports as fully scanned."""
+    plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [m.group(1) for row in plan if (m := FULL_SCAN.match(row.detail))]
+
+
+@pytest.fixture(name="plan_engine")
+def plan_engine_fixture(crud_engine):
+    with crud_engine.begin() as connection:
+        connection.execute(
+            Task.__table__.insert(),
+            [{"title": f"Task {i}", "owner_id": i % 3 + 1} for i in range(30)],
+        )
+        # 統計情報があるとSQLiteのプランナが実運用に近い判断をする
+        connection.exec_driver_sql("ANALYZE")
+    return crud_engine
+
+
+def capture_statements(session_factory, call: CrudCall) -> list[tuple[str, Any]]:
+    statements: list[tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    async def run() -> None:
+        async with session_factory() as db:
+            await call(db)
+
+    sync_engine = session_factory.kw["bind"].sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        asyncio.run(run())
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+@pytest.mark.parametrize("name", sorted(CRUD_QUERIES))
+def test_crud_queries_do_not_scan_full_tables(plan_engine, session_factory, name: str) -> None:
+    statements = capture_statements(session_factory, CRUD_QUERIES[name])
+    assert statements
+
+    with plan_engine.connect() as connection:
+        for statement, parameters in statements:
+            assert full_table_scans(connection, statement, parameters) == [], statement
+
+
+# 一覧の並び順と completed の有無ごとに使われるべきインデックス
+LIST_INDEXES = {
+    ("id", False): "ix_tasks_owner_id_id",
+    ("id", True): "ix_tasks_owner_id_completed_id",
+    ("created_at", False): "ix_tasks_owner_id_created_at_id",
+    ("created_at", True): "ix_tasks_owner_id_completed_created_at_id",
+}
+# タイトルの前方一致は範囲でシークする
+TITLE_INDEX = "ix_tasks_owner_id_title_id"
+LIST_INDEX_SEARCH = re.compile(
+    rf"^SEARCH tasks USING (?:COVERING )?INDEX ({'|'.join([*LIST_INDEXES.values(), TITLE_INDEX])})"
+    r" \(owner_id=\?"
+)
+
+
+def list_filters() -> list[TaskFilter]:
+    """Every combination of the filters GET /tasks/ accepts."""
+    return [
+        TaskFilter(**completed, **period, **prefix)
+        for completed, period, prefix in itertools.product(
+            [{}, {"completed": False}],
+            [{}, {"created_after": datetime(2026, 1, 1)}, {"created_before": datetime(2027, 1, 1)}],
+            [{}, {"title_prefix": "Task 1"}],
+        )
+    ]
+
+
+def list_query_plan(
+    plan_engine, session_factory, task_filter: TaskFilter, sort: TaskSort, keyset: bool
+) -> list[str]:
+    if keyset:
+        call: CrudCall = lambda db: crud_task.get_rows_by_owner_after(  # noqa: E731
+            db,
+            owner_id=1,
+            after_id=10,
+            after_created_at=datetime(2026, 10, 18, 12, 0),
+            limit=10,
+            task_filter=task_filter,
+            sort=sort,
+        )
+    else:
+        call = lambda db: crud_task.get_rows_by_owner(  # noqa: E731
+            db, owner_id=1, skip=10, limit=10, task_filter=task_filter, sort=sort
+        )
+    [(statement, parameters)] = capture_statements(session_factory, call)
+    with plan_engine.connect() as connection:
+        plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row.detail for row in plan]
+
+
+@pytest.mark.parametrize("sort", list(TaskSort))
+def test_task_list_filters_and_sorts_use_matching_index(
+    plan_engine, session_factory, sort: TaskSort
+) -> None:
+    for task_filter, keyset in itertools.product(list_filters(), [False, True]):
+        plan = list_query_plan(plan_engine, session_factory, task_filter, sort, keyset)
+        context = (task_filter.model_dump(exclude_none=True), keyset, plan)
+        searches = [m.group(1) for detail in plan if (m := LIST_INDEX_SEARCH.match(detail))]
+        # 所有者で絞り込んだインデックスの範囲だけを読む
+        assert len(searches) == 1, context
+        ranged = task_filter.created_after or task_filter.created_before or task_filter.title_prefix
+        if not ranged:
+            # 等価条件だけなら、絞り込みと並び順の両方を満たすインデックスをそのまま辿る
+            assert searches[0] == LIST_INDEXES[sort.key, task_filter.completed is not None], context
+        ordered_by = next(key for key in ("title", "created_at", "id") if key in searches[0])
+        if keyset:
+            # 続きのページは並び順の位置からシークする
+            assert ordered_by == sort.key, context
+        # 範囲があるときは、並び順と異なる列の範囲をシークしてから並べ替える計画も選ばれうる
+        assert any(detail.startswith("USE TEMP B-TREE") for detail in plan) == (
+            ordered_by != sort.key
+        ), context
+
+
+@pytest.mark.parametrize("sort", list(TaskSort))
+def test_title_prefix_seeks_title_index(plan_engine, session_factory, sort: TaskSort) -> None:
+    plan = list_query_plan(
+        plan_engine, session_factory, TaskFilter(title_prefix="Task 1"), sort, keyset=False
+    )
+    assert plan[0] == f"SEARCH tasks USING INDEX {TITLE_INDEX} (owner_id=? AND title>? AND title<?)"
@@ -0,0 +1,52 @@
+# tests/crud/test_task_rows.py
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.api.responses import TaskJSONResponse
+from app.crud.task import _created_at, task as crud_task
+from app.models.task import Task
+
+
+def test_row_path_matches_orm_path(crud_engine, session_factory) -> None:
+    with crud_engine.begin() as connection:
+        connection.execute(
+            Task.__table__.insert(),
+            [
+                {
+                    "title": f"Task {i}",
+                    "description": None if i % 4 == 1 else f"D{i}",
+                    "completed": i % 3 == 0,
+                    "owner_id": i % 2 + 1,
+                }
+                for i in range(20)
+            ],
+        )
+
+    async def run():
+        async with session_factory() as db:
+            orm = await crud_task.get_tasks_by_owner(db, owner_id=1, skip=2, limit=5)
+            rows = await crud_task.get_rows_by_owner(db, owner_id=1, skip=2, limit=5)
+            orm_after = await crud_task.get_tasks_by_owner_after(db, owner_id=2, after_id=4)
+            rows_after = await crud_task.get_rows_by_owner_after(db, owner_id=2, after_id=4)
+            # Core経由の読み取りはセッションにインスタンスを残さない
+            identity_size = len(db.identity_map)
+            db.expunge_all()
+            await crud_task.get_rows_by_owner(db, owner_id=1)
+            assert len(db.identity_map) == 0
+        return orm, rows, orm_after, rows_after, identity_size
+
+    orm, rows, orm_after, rows_after, identity_size = asyncio.run(run())
+    assert TaskJSONResponse(rows).body == TaskJSONResponse(orm).body
+    assert TaskJSONResponse(rows_after).body == TaskJSONResponse(orm_after).body
+    assert len(rows) == 5
+    assert identity_size > 0
+
+
+def test_created_at_binds_naive_utc_on_every_dialect() -> None:
+    bind = _created_at(datetime(2026, 1, 1, 9, tzinfo=timezone(timedelta(hours=9))))
+    # SQLite は CURRENT_TIMESTAMP と同じ書式の文字列、それ以外は naive な UTC
+    assert bind.type.process_bind_param(bind.value, sqlite.dialect()) == "2026-01-01 00:00:00"
+    assert bind.type.process_bind_param(bind.value, postgresql.dialect()) == datetime(2026, 1, 1)
@@ -0,0 +1,151 @@
+# tests/crud/test_task_stats.py
+
+import asyncio
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+
+from app.crud.task import task as crud_task
+from app.models.task import Task
+from app.schemas.task import TaskCreate, TaskFilter, TaskUpdate
+
+
+def test_counters_follow_every_write_path(session_factory) -> None:
+    today = datetime.now(timezone.utc).date()
+
+    async def run():
+        async with session_factory() as db:
+            first = await crud_task.create_with_owner(db, TaskCreate(title="a"), owner_id=1)
+            many = await crud_task.create_many_with_owner(
+                db, [TaskCreate(title=f"m{i}") for i in range(4)], owner_id=1
+            )
+            await crud_task.insert_many_with_owner(
+                db, [TaskCreate(title=f"i{i}") for i in range(3)], owner_id=1
+            )
+            await crud_task.create_with_owner(db, TaskCreate(title="other"), owner_id=2)
+            await crud_task.update_owned(
+                db, id=first.id, owner_id=1, obj_in=TaskUpdate(title="a", completed=True)
+            )
+            # 同じ値での更新や、他人のタスクの更新では件数は変わらない
+            await crud_task.update_owned(
+                db, id=first.id, owner_id=1, obj_in=TaskUpdate(title="a", completed=True)
+            )
+            await crud_task.update_owned(
+                db, id=first.id, owner_id=2, obj_in=TaskUpdate(title="x", completed=False)
+            )
+            await crud_task.update_by_filter(
+                db,
+                owner_id=1,
+                task_filter=TaskFilter(ids=[t.id for t in many]),
+                values={"completed": True},
+            )
+            await crud_task.update_by_filter(
+                db,
+                owner_id=1,
+                task_filter=TaskFilter(ids=[many[0].id]),
+                values={"completed": False},
+            )
+            await crud_task.remove_owned(db, id=many[1].id, owner_id=1)
+            await crud_task.remove_by_filter(
+                db, owner_id=1, task_filter=TaskFilter(ids=[many[2].id, first.id])
+            )
+            stats = await crud_task.get_stats(db, owner_id=1, since=date(2000, 1, 1))
+            drift = await crud_task.find_stats_drift(db)
+        return stats, drift
+
+    stats, drift = asyncio.run(run())
+    # 8件作成し3件削除。完了は many[3] の1件のみ残る
+    assert stats == (5, 1, [(today, 5)])
+    assert drift == []
+
+
+def test_writes_matching_nothing_keep_version(session_factory) -> None:
+
+    async def run():
+        async with session_factory() as db:
+            first = await crud_task.create_with_owner(db, TaskCreate(title="a"), owner_id=1)
+            before = await crud_task.get_version(db, owner_id=1)
+            # 他人のタスク・存在しないタスクの更新
+            for id, owner_id in ((first.id, 2), (999, 1)):
+                await crud_task.update_owned(
+                    db, id=id, owner_id=owner_id, obj_in=TaskUpdate(title="x", completed=True)
+                )
+            for values in ({"completed": True}, {"title": "x"}):
+                await crud_task.update_by_filter(
+                    db, owner_id=1, task_filter=TaskFilter(ids=[999]), values=values
+                )
+            after = await crud_task.get_version(db, owner_id=1)
+            owners = (await db.execute(text("SELECT owner_id FROM task_counters"))).all()
+        return before, after, owners
+
+    before, after, owners = asyncio.run(run())
+    assert after == before
+    # 書き込みのなかった所有者のカウンタ行は作らない
+    assert owners == [(1,)]
+
+
+def test_overlapping_toggles_keep_counters_exact(session_factory) -> None:
+
+    async def toggle(task_id: int, completed: bool, by_filter: bool) -> None:
+        # 別々のセッション（接続）から同じタスクを同時に更新する
+        async with session_factory() as db:
+            if by_filter:
+                await crud_task.update_by_filter(
+                    db,
+                    owner_id=1,
+                    task_filter=TaskFilter(ids=[task_id]),
+                    values={"completed": completed},
+                )
+            else:
+                await crud_task.update_owned(
+                    db,
+                    id=task_id,
+                    owner_id=1,
+                    obj_in=TaskUpdate(title="a", completed=completed),
+                )
+
+    async def run():
+        async with session_factory() as db:
+            first = await crud_task.create_with_owner(db, TaskCreate(title="a"), owner_id=1)
+        await asyncio.gather(
+            *(toggle(first.id, i % 3 != 0, by_filter=i % 2 == 0) for i in range(12))
+        )
+        async with session_factory() as db:
+            return await crud_task.find_stats_drift(db)
+
+    assert asyncio.run(run()) == []
+
+
+def test_rebuild_repairs_drift(session_factory) -> None:
+
+    async def run():
+        async with session_factory() as db:
+            await crud_task.create_with_owner(db, TaskCreate(title="tracked"), owner_id=1)
+            # カウンタを経由しない書き込み（手作業のSQLや導入前のデータ）
+            await db.execute(
+                Task.__table__.insert(),
+                [
+                    {
+                        "title": "old",
+                        "owner_id": 2,
+                        "completed": True,
+                        "created_at": datetime(2026, 1, 2, 3, 4, 5),
+                    }
+                ],
+            )
+            await db.execute(text("UPDATE task_counters SET total = 7 WHERE owner_id = 1"))
+            await db.commit()
+            before = await crud_task.find_stats_drift(db)
+            await crud_task.rebuild_stats(db, owner_id=1)
+            after_one = await crud_task.find_stats_drift(db)
+            await crud_task.rebuild_stats(db)
+            after_all = await crud_task.find_stats_drift(db)
+            stats = await crud_task.get_stats(db, owner_id=2, since=date(2026, 1, 1))
+        return before, after_one, after_all, stats
+
+    before, after_one, after_all, stats = asyncio.run(run())
+    assert (1, "total", 7, 1) in before
+    assert (2, "2026-01-02", 0, 1) in before
+    assert {owner for owner, *_ in after_one} == {2}
+    assert after_all == []
+    assert stats == (1, 1, [(date(2026, 1, 2), 1)])
@@ -0,0 +1,95 @@
+# tests/crud/test_write_statements.py
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.task import task as crud_task
+from app.crud.user import user as crud_user
+from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.user import UserCreate
+
+
+def count_statements(session_factory, write: Callable[[AsyncSession], Awaitable[Any]]):
+    """Run `write` after a fresh user/task exist and return (result, SQL statements emitted)."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    async def run() -> Any:
+        async with session_factory() as db:
+            owner = await crud_user.create(
+                db, obj_in=UserCreate(email="writer@example.com", password="hashed")
+            )
+            existing = await crud_task.create_with_owner(
+                db, obj_in=TaskCreate(title="Existing"), owner_id=owner.id
+            )
+            sync_engine = db.bind.sync_engine
+            event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+            try:
+                result = await write(db, owner, existing)
+                # コミット後の属性アクセスで追加のSELECTが発生しないこと
+                result.id, result.created_at
+            finally:
+                event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+            return result
+
+    return asyncio.run(run()), statements
+
+
+def test_create_with_owner_is_insert_plus_counters(session_factory) -> None:
+    task, statements = count_statements(
+        session_factory,
+        lambda db, owner, existing: crud_task.create_with_owner(
+            db, obj_in=TaskCreate(title="New"), owner_id=owner.id
+        ),
+    )
+    # タスクのINSERTと、所有者のカウンタ・日別件数の更新（upsert）の3文のみ
+    assert len(statements) == 3
+    assert sorted(s.split("(")[0].strip() for s in statements) == [
+        "INSERT INTO task_counters",
+        "INSERT INTO task_daily_counts",
+        "INSERT INTO tasks",
+    ]
+    assert task.created_at is not None
+
+
+def test_user_create_is_one_statement(session_factory) -> None:
+    user, statements = count_statements(
+        session_factory,
+        lambda db, owner, existing: crud_user.create(
+            db, obj_in=UserCreate(email="second@example.com", password="hashed")
+        ),
+    )
+    assert len(statements) == 1
+    assert user.created_at is not None
+    assert user.is_active is True
+
+
+def test_base_update_is_one_statement(session_factory) -> None:
+    user, statements = count_statements(
+        session_factory,
+        lambda db, owner, existing: crud_user.update(
+            db, db_obj=owner, obj_in={"is_active": False, "password": "ignored"}
+        ),
+    )
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE")
+    assert user.is_active is False
+
+
+def test_update_owned_is_update_plus_counters(session_factory) -> None:
+    task, statements = count_statements(
+        session_factory,
+        lambda db, owner, existing: crud_task.update_owned(
+            db, id=existing.id, owner_id=owner.id, obj_in=TaskUpdate(title="Done", completed=True)
+        ),
+    )
+    # completed を変える場合は、更新前の値から差分を取るためカウンタを先に更新する
+    assert len(statements) == 2
+    assert statements[0].startswith("INSERT INTO task_counters")
+    assert statements[1].startswith("UPDATE tasks")
+    assert task.completed is True
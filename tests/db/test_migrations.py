@@ -0,0 +1,42 @@
+# tests/db/test_migrations.py
+
+import shutil
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect
+
+from app.db.base import Base
+from app.db.search import is_search_object
+from app.models import task, task_counter, user  # noqa: F401
+
+
+def test_migrations_match_models(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    config = Config("alembic.ini")
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+
+        # マイグレーション適用後のスキーマとモデル定義に差分がないこと
+        context = MigrationContext.configure(
+            connection,
+            opts={"include_name": lambda name, type_, parent: not is_search_object(name)},
+        )
+        diff = compare_metadata(context, Base.metadata)
+        assert diff == []
+
+        command.downgrade(config, "base")
+
+
+def test_upgrade_from_committed_database(tmp_path) -> None:
+    # 同梱の sql_app.db は初期リビジョン（テーブルなし）でスタンプ済み
+    shutil.copy("sql_app.db", tmp_path / "stamped.db")
+    engine = create_engine(f"sqlite:///{tmp_path / 'stamped.db'}")
+    config = Config("alembic.ini")
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+        assert {"users", "tasks", "task_counters"} <= set(inspect(connection).get_table_names())
@@ -0,0 +1,74 @@
+# tests/db/test_pool.py
+
+import asyncio
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool, PoolTelemetry
+from app.db.session import _async_engine_args
+
+
+def _engine(tmp_path, **kw):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool, **kw
+    )
+    telemetry = PoolTelemetry()
+    telemetry.attach(engine.sync_engine)
+    return engine, telemetry
+
+
+def test_pool_telemetry_counts_in_use_and_overflow(tmp_path) -> None:
+    engine, telemetry = _engine(tmp_path, pool_size=1, max_overflow=1)
+
+    async def run() -> tuple[dict, dict]:
+        async with engine.connect() as first, engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+            busy = telemetry.stats(engine.sync_engine.pool)
+        idle = telemetry.stats(engine.sync_engine.pool)
+        await engine.dispose()
+        return busy, idle
+
+    busy, idle = asyncio.run(run())
+    assert busy["in_use"] == 2
+    assert busy["overflow"] == 1
+    assert busy["size"] == 1
+    assert idle["in_use"] == 0
+    assert idle["checkouts"] == 2
+    assert idle["connects"] == 2
+    assert sum(idle["wait_buckets"].values()) == 2
+
+
+def test_pool_telemetry_records_checkout_timeouts(tmp_path) -> None:
+    engine, telemetry = _engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=0.1)
+
+    async def run() -> None:
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+        # dispose() で作り直したプールでも計測が続くこと
+        await engine.dispose()
+        async with engine.connect():
+            pass
+        await engine.dispose()
+
+    asyncio.run(run())
+    stats = telemetry.stats(engine.sync_engine.pool)
+    assert stats["timeouts"] == 1
+    assert stats["wait_seconds_max"] >= 0.1
+    assert sum(stats["wait_buckets"].values()) == 3
+
+
+def test_engine_args_use_pool_settings_for_postgres(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 7)
+    monkeypatch.setattr(settings, "DB_POOL_PRE_PING", True)
+    args = _async_engine_args("postgresql+asyncpg://user:pass@db/app")
+    assert args["poolclass"] is InstrumentedQueuePool
+    assert args["pool_size"] == 7
+    assert args["pool_pre_ping"] is True
+    # NullPool / StaticPool の SQLite には容量の設定を渡さない
+    assert "pool_size" not in _async_engine_args("sqlite+aiosqlite://")
@@ -0,0 +1,72 @@
+# tests/db/test_routing.py
+
+import asyncio
+import time
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.db.pool import PoolTelemetry
+from app.db.routing import DatabaseRouter
+from app.db.session import get_write_db
+
+primary = async_sessionmaker()
+
+
+def _replicas(count: int) -> list[tuple[async_sessionmaker, PoolTelemetry]]:
+    return [(async_sessionmaker(), PoolTelemetry()) for _ in range(count)]
+
+
+def test_reads_use_primary_without_replicas() -> None:
+    router = DatabaseRouter(primary)
+    assert router.reader("Bearer a") is primary
+    assert router.writer() is primary
+
+
+def test_round_robin_alternates_replicas() -> None:
+    replicas = _replicas(2)
+    router = DatabaseRouter(primary, replicas=replicas)
+    picked = [router.reader() for _ in range(4)]
+    assert picked == [replicas[0][0], replicas[1][0], replicas[0][0], replicas[1][0]]
+
+
+def test_least_busy_prefers_replica_with_fewer_connections() -> None:
+    replicas = _replicas(2)
+    replicas[0][1].in_use = 3
+    replicas[1][1].in_use = 1
+    router = DatabaseRouter(primary, replicas=replicas, selection="least_busy")
+    assert {router.reader() for _ in range(4)} == {replicas[1][0]}
+
+
+def test_write_pins_client_reads_to_primary() -> None:
+    replicas = _replicas(1)
+    router = DatabaseRouter(primary, replicas=replicas, pin_seconds=0.05)
+    router.mark_write("Bearer writer")
+    assert router.reader("Bearer writer") is primary
+    # 他のクライアントはレプリカのまま
+    assert router.reader("Bearer other") is replicas[0][0]
+    time.sleep(0.06)
+    assert router.reader("Bearer writer") is replicas[0][0]
+
+
+def test_long_write_keeps_client_pinned_after_it_finishes() -> None:
+    replicas = _replicas(1)
+    router = DatabaseRouter(primary, replicas=replicas, pin_seconds=0.05)
+    request = Request({"type": "http", "headers": [(b"authorization", b"Bearer writer")]})
+
+    async def write() -> None:
+        sessions = get_write_db(request, router)
+        await sessions.__anext__()
+        # ピンの期限より長くかかる書き込み
+        await asyncio.sleep(0.06)
+        await sessions.aclose()
+
+    asyncio.run(write())
+    assert router.reader("Bearer writer") is primary
+
+
+def test_pinning_disabled_with_zero_window() -> None:
+    replicas = _replicas(1)
+    router = DatabaseRouter(primary, replicas=replicas, pin_seconds=0)
+    router.mark_write("Bearer writer")
+    assert router.reader("Bearer writer") is replicas[0][0]